@@ -15,10 +15,13 @@ def calculate_daily_totals(entries: list[FoodEntry]) -> tuple[int, float, float,
     Returns:
         Tuple of (calories, protein, carbs, fat)
     """
-    total_calories = sum(e.calories for e in entries)
-    total_protein = sum(e.protein for e in entries)
-    total_carbs = sum(e.carbs for e in entries)
-    total_fat = sum(e.fat for e in entries)
+    # Single pass over the entries instead of one sum() per macro
+    total_calories = total_protein = total_carbs = total_fat = 0
+    for e in entries:
+        total_calories += e.calories
+        total_protein += e.protein
+        total_carbs += e.carbs
+        total_fat += e.fat
 
     return total_calories, total_protein, total_carbs, total_fat
 
@@ -39,15 +42,16 @@ def calculate_daily_summary(entries: list[FoodEntry], settings: UserSettings) ->
     if settings.fat_goal is not None:
         fat_remaining = settings.fat_goal - total_fat
 
+    # Values stay at full precision; DailySummary rounds them when dumped
     return DailySummary(
         total_calories=total_cal,
-        total_protein=round(total_pro, 1),
-        total_carbs=round(total_carb, 1),
-        total_fat=round(total_fat, 1),
+        total_protein=total_pro,
+        total_carbs=total_carb,
+        total_fat=total_fat,
         calories_remaining=settings.calorie_goal - total_cal,
-        protein_remaining=round(settings.protein_goal - total_pro, 1),
-        carbs_remaining=round(settings.carb_goal - total_carb, 1),
-        fat_remaining=round(fat_remaining, 1) if fat_remaining is not None else None,
+        protein_remaining=settings.protein_goal - total_pro,
+        carbs_remaining=settings.carb_goal - total_carb,
+        fat_remaining=fat_remaining,
     )
 
 
@@ -64,4 +68,6 @@ def calculate_calories_from_macros(protein: float, carbs: float, fat: float) ->
     Returns:
         Estimated calories (rounded to nearest integer)
     """
-    return round(protein * 4 + carbs * 4 + fat * 9)
+    # Scaling by 4 is exact in binary floating point, so factoring it out
+    # gives the same result as protein * 4 + carbs * 4 with one less multiply
+    return round(4 * (protein + carbs) + 9 * fat)
@@ -3,51 +3,87 @@
 All models are immutable value objects with no behavior beyond validation.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from datetime import date as DateType
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 import uuid
 
 
+def _now() -> datetime:
+    """Current time as an aware UTC datetime (datetime.utcnow is deprecated)."""
+    return datetime.now(timezone.utc)
+
+
+def _new_id() -> str:
+    """Random 32-char hex id (uuid4 without dash formatting)."""
+    return uuid.uuid4().hex
+
+
+def _round_1dp(value: float | None) -> float | None:
+    """Round gram amounts to one decimal place for output."""
+    return None if value is None else round(value, 1)
+
+
 class UserSettings(BaseModel):
     """User configuration for daily goals and metrics."""
 
+    model_config = ConfigDict(frozen=True)
+
     calorie_goal: int = Field(ge=0, description="Daily calorie target")
     protein_goal: int = Field(ge=0, description="Daily protein target in grams")
     carb_goal: int = Field(ge=0, description="Daily carbohydrate target in grams")
     fat_goal: Optional[int] = Field(default=None, ge=0, description="Daily fat target in grams")
     resting_energy: int = Field(ge=0, description="Daily resting energy expenditure in calories")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
 
 
 class FoodEntry(BaseModel):
     """A single food item logged by the user."""
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(frozen=True)
+
+    id: str = Field(default_factory=_new_id)
     name: str = Field(min_length=1, description="Name of the food")
     description: Optional[str] = Field(default=None, description="Details about preparation/quantity")
     calories: int = Field(ge=0, description="Total calories")
     protein: float = Field(ge=0, description="Protein in grams")
     carbs: float = Field(ge=0, description="Carbohydrates in grams")
     fat: float = Field(ge=0, description="Fat in grams")
-    logged_at: datetime = Field(default_factory=datetime.utcnow)
+    logged_at: datetime = Field(default_factory=_now)
 
 
 class DailyLog(BaseModel):
     """A day's food log containing all entries."""
 
+    model_config = ConfigDict(frozen=True)
+
     log_date: DateType = Field(description="Date of this log (YYYY-MM-DD)")
     entries: list[FoodEntry] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
+
+
+class FoodEntryInput(BaseModel):
+    """The fields a caller supplies to log a food; IDs and times are assigned."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    name: str = Field(min_length=1, description="Name of the food")
+    description: Optional[str] = Field(default=None, description="Details about preparation/quantity")
+    calories: int = Field(ge=0, description="Total calories")
+    protein: float = Field(ge=0, description="Protein in grams")
+    carbs: float = Field(ge=0, description="Carbohydrates in grams")
+    fat: float = Field(ge=0, description="Fat in grams")
 
 
 class CachedFood(BaseModel):
     """A frequently used food item saved for quick reuse."""
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(frozen=True)
+
+    id: str = Field(default_factory=_new_id)
     name: str = Field(min_length=1, description="Name of the food (used for searching)")
     description: Optional[str] = Field(default=None, description="Default description")
     calories: int = Field(ge=0, description="Calories per serving")
@@ -55,13 +91,15 @@ class CachedFood(BaseModel):
     carbs: float = Field(ge=0, description="Carbohydrates in grams")
     fat: float = Field(ge=0, description="Fat in grams")
     use_count: int = Field(default=0, ge=0, description="Times this food has been logged")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    last_used: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    last_used: datetime = Field(default_factory=_now)
 
 
 class DailySummary(BaseModel):
     """Summary of daily intake calculated from entries."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     total_calories: int = Field(ge=0)
     total_protein: float = Field(ge=0)
     total_carbs: float = Field(ge=0)
@@ -71,10 +109,18 @@ class DailySummary(BaseModel):
     carbs_remaining: float = Field(description="Negative if over goal")
     fat_remaining: Optional[float] = Field(default=None, description="None if no fat goal set")
 
+    # Totals are kept at full precision; rounding happens only when dumped
+    _round_grams = field_serializer(
+        "total_protein", "total_carbs", "total_fat",
+        "protein_remaining", "carbs_remaining", "fat_remaining",
+    )(_round_1dp)
+
 
 class DaySummary(BaseModel):
     """Summary for a single day in weekly report."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     log_date: DateType
     total_calories: int
     total_protein: float
@@ -82,10 +128,14 @@ class DaySummary(BaseModel):
     total_fat: float
     entry_count: int
 
+    _round_grams = field_serializer("total_protein", "total_carbs", "total_fat")(_round_1dp)
+
 
 class WeeklyReport(BaseModel):
     """Weekly report with daily summaries and aggregate metrics."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     week_start: DateType
     week_end: DateType
     daily_summaries: list[DaySummary]
@@ -97,10 +147,14 @@ class WeeklyReport(BaseModel):
     fat_added: int = Field(description="Total calories - (days * resting_energy). Negative = deficit.")
     days_logged: int
 
+    _round_averages = field_serializer(
+        "avg_daily_calories", "total_protein", "total_carbs", "total_fat",
+    )(_round_1dp)
+
 
 class User(BaseModel):
     """User record stored in Firestore."""
 
     email: str
     api_key_hash: str = Field(description="SHA256 hash of API key - never store plaintext")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
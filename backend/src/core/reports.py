@@ -4,9 +4,9 @@ All functions are pure: same input always produces same output, no side effects.
 """
 
 from datetime import date, timedelta
+from functools import lru_cache
 
 from .models import DailyLog, UserSettings, WeeklyReport, DaySummary
-from .macros import calculate_daily_totals
 
 
 def generate_day_summary(log: DailyLog) -> DaySummary:
@@ -18,18 +18,54 @@ def generate_day_summary(log: DailyLog) -> DaySummary:
     Returns:
         DaySummary with totals for the day
     """
-    total_cal, total_pro, total_carb, total_fat = calculate_daily_totals(log.entries)
+    entries_key = tuple((e.calories, e.protein, e.carbs, e.fat) for e in log.entries)
+    return _day_summary_cached(entries_key, log.log_date)
 
-    return DaySummary(
-        log_date=log.log_date,
+
+@lru_cache(maxsize=4096)
+def _day_summary_cached(
+    entries_key: tuple[tuple[int, float, float, float], ...], log_date: date
+) -> DaySummary:
+    """Build a DaySummary from per-entry (calories, protein, carbs, fat) tuples.
+
+    Memoized on the macros rather than the log itself, so regenerating a
+    report over unchanged days reuses the summaries already built. The
+    returned DaySummary is frozen, so sharing it between reports is safe.
+    """
+    total_cal = 0
+    total_pro = total_carb = total_fat = 0.0
+    for calories, protein, carbs, fat in entries_key:
+        total_cal += calories
+        total_pro += protein
+        total_carb += carbs
+        total_fat += fat
+
+    # Totals come straight from validated entries, so skip re-validation
+    return DaySummary.model_construct(
+        log_date=log_date,
         total_calories=total_cal,
-        total_protein=round(total_pro, 1),
-        total_carbs=round(total_carb, 1),
-        total_fat=round(total_fat, 1),
-        entry_count=len(log.entries),
+        total_protein=total_pro,
+        total_carbs=total_carb,
+        total_fat=total_fat,
+        entry_count=len(entries_key),
     )
 
 
+def index_logs_by_date(logs: list[DailyLog]) -> dict[date, DailyLog]:
+    """Index daily logs by date.
+
+    Build this once when generating reports for several weeks from the same
+    history, so each report only does seven lookups.
+
+    Args:
+        logs: List of daily logs
+
+    Returns:
+        Dictionary mapping each log's date to the log
+    """
+    return {log.log_date: log for log in logs}
+
+
 def calculate_fat_added(total_calories: int, days: int, resting_energy: int) -> int:
     """Calculate fat added/lost based on caloric balance.
 
@@ -49,14 +85,15 @@ def calculate_fat_added(total_calories: int, days: int, resting_energy: int) ->
 
 
 def generate_weekly_report(
-    logs: list[DailyLog],
+    logs: list[DailyLog] | dict[date, DailyLog],
     settings: UserSettings,
     week_start: date | None = None,
 ) -> WeeklyReport:
     """Generate a weekly report from daily logs.
 
     Args:
-        logs: List of daily logs (may be empty or partial week)
+        logs: Daily logs (may be empty or partial week), as a list or as a
+            dict from index_logs_by_date
         settings: User settings for resting energy calculation
         week_start: Start date of the week (defaults to 7 days ago)
 
@@ -68,20 +105,22 @@ def generate_weekly_report(
 
     week_end = week_start + timedelta(days=6)
 
-    # Filter logs to the requested week
-    week_logs = [
-        log for log in logs
-        if week_start <= log.log_date <= week_end
-    ]
+    # Look up the seven days of the week directly, in date order
+    logs_by_date = logs if isinstance(logs, dict) else index_logs_by_date(logs)
+    week_dates = [week_start + timedelta(days=i) for i in range(7)]
 
     # Generate daily summaries
-    daily_summaries = [generate_day_summary(log) for log in sorted(week_logs, key=lambda x: x.log_date)]
+    daily_summaries = [
+        generate_day_summary(logs_by_date[d]) for d in week_dates if d in logs_by_date
+    ]
 
-    # Calculate aggregates
-    total_calories = sum(s.total_calories for s in daily_summaries)
-    total_protein = sum(s.total_protein for s in daily_summaries)
-    total_carbs = sum(s.total_carbs for s in daily_summaries)
-    total_fat = sum(s.total_fat for s in daily_summaries)
+    # Calculate aggregates in a single pass over the summaries
+    total_calories = total_protein = total_carbs = total_fat = 0
+    for s in daily_summaries:
+        total_calories += s.total_calories
+        total_protein += s.total_protein
+        total_carbs += s.total_carbs
+        total_fat += s.total_fat
     days_logged = len(daily_summaries)
 
     avg_daily_calories = total_calories / days_logged if days_logged > 0 else 0
@@ -94,10 +133,10 @@ def generate_weekly_report(
         week_end=week_end,
         daily_summaries=daily_summaries,
         total_calories=total_calories,
-        avg_daily_calories=round(avg_daily_calories, 1),
-        total_protein=round(total_protein, 1),
-        total_carbs=round(total_carbs, 1),
-        total_fat=round(total_fat, 1),
+        avg_daily_calories=avg_daily_calories,
+        total_protein=total_protein,
+        total_carbs=total_carbs,
+        total_fat=total_fat,
         fat_added=fat_added,
         days_logged=days_logged,
     )
@@ -6,17 +6,20 @@ Uses Starlette with the MCP HTTP app for maximum compatibility.
 
 import logging
 import os
+import threading
+from contextlib import asynccontextmanager
 
+import orjson
 import uvicorn
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route, Mount
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from .shell.mcp_server import mcp, current_user_id, get_auth_client
+from .shell.mcp_server import mcp, current_user_id, get_auth_client, warm_up_clients
 from .shell.auth import validate_api_key_format, hash_api_key
 
 
@@ -26,23 +29,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+BEARER_PREFIX = "Bearer "
+
+# CORS settings: allow only the headers our web and MCP clients send, and let
+# browsers cache the preflight response for a day
+CORS_ALLOW_ORIGINS = ("https://foodlogr.app", "http://localhost:5173")
+CORS_ALLOW_HEADERS = (
+    "authorization",
+    "content-type",
+    "accept",
+    "mcp-protocol-version",
+    "mcp-session-id",
+)
+CORS_MAX_AGE = 86400
+
 
 # ==================== Route Handlers ====================
 
 
-async def health_check(request: Request) -> JSONResponse:
+def json_response(payload: dict | bytes, status_code: int = 200) -> Response:
+    """Build a JSON response serialized with orjson (bytes are sent as-is)."""
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+# Fixed response bodies, serialized once at import
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "foodlogr-mcp"})
+_INVALID_EMAIL_BODY = orjson.dumps({"error": "Valid email is required"})
+_REGISTRATION_FAILED_BODY = orjson.dumps({"error": "Registration failed."})
+_KEY_REQUIRED_BODY = orjson.dumps({"valid": False, "error": "API key required"})
+_KEY_VALID_BODY = orjson.dumps({"valid": True})
+_KEY_INVALID_BODY = orjson.dumps({"valid": False})
+_VALIDATION_FAILED_BODY = orjson.dumps({"valid": False, "error": "Validation failed"})
+
+
+async def health_check(request: Request) -> Response:
     """Health check endpoint for Cloud Run."""
-    return JSONResponse({"status": "healthy", "service": "foodlogr-mcp"})
+    return json_response(_HEALTH_BODY)
 
 
-async def register_user(request: Request) -> JSONResponse:
+async def register_user(request: Request) -> Response:
     """Register a new user and return their API key."""
     try:
-        body = await request.json()
-        email = body.get("email")
-
-        if not email or "@" not in email:
-            return JSONResponse({"error": "Valid email is required"}, status_code=400)
+        match orjson.loads(await request.body()):
+            case {"email": str(email)} if "@" in email:
+                pass
+            case _:
+                return json_response(_INVALID_EMAIL_BODY, status_code=400)
 
         auth_client = get_auth_client()
         api_key, user_id = auth_client.register_user(email)
@@ -51,7 +84,7 @@ async def register_user(request: Request) -> JSONResponse:
             "BASE_URL", "https://foodlogr-mcp-504360050716.us-central1.run.app"
         )
 
-        return JSONResponse({
+        return json_response({
             "api_key": api_key,
             "message": "Registration successful! Save your API key - it won't be shown again.",
             "claude_command": f'claude mcp add --transport http foodlogr {base_url}/mcp --header "Authorization: Bearer {api_key}"',
@@ -59,53 +92,80 @@ async def register_user(request: Request) -> JSONResponse:
 
     except Exception as e:
         logger.error("Registration failed: %s", str(e))
-        return JSONResponse({"error": "Registration failed."}, status_code=500)
+        return json_response(_REGISTRATION_FAILED_BODY, status_code=500)
 
 
-async def validate_key(request: Request) -> JSONResponse:
+async def validate_key(request: Request) -> Response:
     """Validate an API key."""
     try:
-        body = await request.json()
-        api_key = body.get("api_key")
-
-        if not api_key:
-            return JSONResponse({"valid": False, "error": "API key required"})
+        match orjson.loads(await request.body()):
+            case {"api_key": str(api_key)} if api_key:
+                pass
+            case _:
+                return json_response(_KEY_REQUIRED_BODY)
 
         auth_client = get_auth_client()
         user_id = auth_client.validate_api_key(api_key)
-        return JSONResponse({"valid": user_id is not None})
+        return json_response(_KEY_VALID_BODY if user_id is not None else _KEY_INVALID_BODY)
 
     except Exception as e:
         logger.error("Validation failed: %s", str(e))
-        return JSONResponse({"valid": False, "error": "Validation failed"})
+        return json_response(_VALIDATION_FAILED_BODY)
 
 
 # ==================== Auth Middleware ====================
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Authenticate MCP requests using API key in Authorization header."""
-
-    async def dispatch(self, request: Request, call_next):
-        # Skip auth for non-MCP routes
-        if not request.url.path.startswith("/mcp"):
-            return await call_next(request)
-
-        auth_header = request.headers.get("Authorization", "")
-
-        if auth_header.startswith("Bearer "):
-            api_key = auth_header.replace("Bearer ", "")
+class AuthMiddleware:
+    """Authenticate MCP requests using API key in Authorization header.
 
-            if validate_api_key_format(api_key):
-                user_id = hash_api_key(api_key)
-                auth_client = get_auth_client()
+    Plain ASGI middleware: reads the header straight from the scope instead
+    of wrapping each request in BaseHTTPMiddleware's extra task and stream.
+    """
 
-                if auth_client.user_exists(user_id):
-                    # Set user context for this request
-                    current_user_id.set(user_id)
-                    logger.debug("Authenticated user: %s", user_id[:8])
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip auth for non-MCP routes
+        if scope["type"] != "http" or not scope["path"].startswith("/mcp"):
+            await self.app(scope, receive, send)
+            return
+
+        user_id = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                user_id = self._authenticate(value.decode("latin-1"))
+                break
+
+        if user_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Set user context for this request
+        token = current_user_id.set(user_id)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_user_id.reset(token)
+
+    @staticmethod
+    def _authenticate(auth_header: str) -> str | None:
+        """Resolve an Authorization header value to a user_id, if valid."""
+        if not auth_header.startswith(BEARER_PREFIX):
+            return None
+
+        api_key = auth_header[len(BEARER_PREFIX):]
+        if not validate_api_key_format(api_key):
+            return None
+
+        user_id = hash_api_key(api_key)
+        if not get_auth_client().user_exists(user_id):
+            return None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Authenticated user: %s", user_id[:8])
+        return user_id
 
 
 # ==================== Create ASGI App ====================
@@ -120,6 +180,13 @@ def create_app() -> Starlette:
     # Get the MCP ASGI app
     mcp_app = mcp.streamable_http_app()
 
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        # Warm up Firestore in the background so startup isn't blocked on it
+        threading.Thread(target=warm_up_clients, name="firestore-warmup", daemon=True).start()
+        async with mcp_app.router.lifespan_context(app):
+            yield
+
     # Define routes - custom routes first, then MCP app at root
     routes = [
         Route("/health", health_check, methods=["GET"]),
@@ -135,13 +202,14 @@ def create_app() -> Starlette:
         middleware=[
             Middleware(
                 CORSMiddleware,
-                allow_origins=["https://foodlogr.app", "http://localhost:5173"],
+                allow_origins=CORS_ALLOW_ORIGINS,
                 allow_methods=["GET", "POST", "OPTIONS"],
-                allow_headers=["*"],
+                allow_headers=CORS_ALLOW_HEADERS,
+                max_age=CORS_MAX_AGE,
             ),
             Middleware(AuthMiddleware),
         ],
-        lifespan=mcp_app.router.lifespan_context,
+        lifespan=lifespan,
     )
 
     return app
@@ -156,10 +224,23 @@ def main() -> None:
     port = int(os.environ.get("PORT", 8080))
     host = os.environ.get("HOST", "0.0.0.0")
 
-    logger.info("Starting FoodLogr MCP server on %s:%d", host, port)
-
-    uvicorn.run(app, host=host, port=port)
-
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+    logger.info("Starting FoodLogr MCP server on %s:%d (%d workers)", host, port, workers)
+
+    # httptools is the C-backed HTTP parser; the "auto" loop is uvloop where
+    # it is installed (not on Windows). Access logging is off because Cloud
+    # Run already logs every request. Multiple workers need the app as an
+    # import string, which only resolves when started from backend/.
+    uvicorn.run(
+        "src.main:app" if workers > 1 else app,
+        host=host,
+        port=port,
+        workers=workers,
+        loop="auto",
+        http="httptools",
+        access_log=False,
+    )
 
 if __name__ == "__main__":
     main()
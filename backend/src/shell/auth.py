@@ -6,7 +6,9 @@ Handles API key creation, hashing, and validation. Never stores plaintext keys.
 import hashlib
 import logging
 import secrets
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
 
 from google.cloud import firestore
 
@@ -18,6 +20,16 @@ logger = logging.getLogger(__name__)
 # API key prefix for identification
 API_KEY_PREFIX = "flr_"
 
+# prefix + at least some random chars
+API_KEY_MIN_LENGTH = 40
+
+# Empty field mask: existence checks only need document metadata, not the body
+_EXISTS_ONLY: list[str] = []
+
+# How long a confirmed user_id is trusted before Firestore is asked again
+_USER_EXISTS_TTL = 300
+_USER_EXISTS_MAX_ENTRIES = 10_000
+
 
 def generate_api_key() -> str:
     """Generate a cryptographically secure API key.
@@ -35,13 +47,17 @@ def hash_api_key(api_key: str) -> str:
     Uses SHA256 and truncates to 32 chars for Firestore document ID.
     Never store plaintext API keys.
 
+    The user_id is the stored identity of every account, so the algorithm
+    must not change. Only the first 16 bytes of the digest are hex-encoded,
+    which equals hexdigest()[:32] without formatting the unused half.
+
     Args:
         api_key: The plaintext API key
 
     Returns:
         32-character hash to use as user_id
     """
-    return hashlib.sha256(api_key.encode()).hexdigest()[:32]
+    return hashlib.sha256(api_key.encode()).digest()[:16].hex()
 
 
 def validate_api_key_format(api_key: str) -> bool:
@@ -53,13 +69,13 @@ def validate_api_key_format(api_key: str) -> bool:
     Returns:
         True if format is valid
     """
-    if not api_key:
-        return False
-    if not api_key.startswith(API_KEY_PREFIX):
-        return False
-    if len(api_key) < 40:  # prefix + at least some random chars
-        return False
-    return True
+    # Cheapest checks first: empty and too-short keys are rejected before
+    # the prefix comparison
+    return (
+        bool(api_key)
+        and len(api_key) >= API_KEY_MIN_LENGTH
+        and api_key.startswith(API_KEY_PREFIX)
+    )
 
 
 class AuthClient:
@@ -75,11 +91,34 @@ class AuthClient:
             db: Firestore client instance
         """
         self._db = db
+        # user_id -> expiry (monotonic seconds), most recently used last
+        self._known_users: OrderedDict[str, float] = OrderedDict()
+        self._known_users_lock = threading.Lock()
 
     def _get_user_ref(self, user_id: str) -> firestore.DocumentReference:
         """Get reference to user document."""
         return self._db.collection("users").document(user_id)
 
+    def _remember_user(self, user_id: str) -> None:
+        """Record that user_id exists, evicting the least recently used."""
+        with self._known_users_lock:
+            self._known_users[user_id] = time.monotonic() + _USER_EXISTS_TTL
+            self._known_users.move_to_end(user_id)
+            if len(self._known_users) > _USER_EXISTS_MAX_ENTRIES:
+                self._known_users.popitem(last=False)
+
+    def _is_known_user(self, user_id: str) -> bool:
+        """Check whether user_id was confirmed to exist within the TTL."""
+        with self._known_users_lock:
+            expires_at = self._known_users.get(user_id)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._known_users[user_id]
+                return False
+            self._known_users.move_to_end(user_id)
+            return True
+
     def register_user(self, email: str) -> tuple[str, str]:
         """Register a new user and generate their API key.
 
@@ -94,13 +133,10 @@ class AuthClient:
         api_key = generate_api_key()
         user_id = hash_api_key(api_key)
 
-        user = User(
-            email=email,
-            api_key_hash=user_id,
-            created_at=datetime.utcnow(),
-        )
+        user = User(email=email, api_key_hash=user_id)
 
         self._get_user_ref(user_id).set(user.model_dump())
+        self._remember_user(user_id)
 
         logger.info("User registered successfully: %s", user_id[:8])
         return api_key, user_id
@@ -121,9 +157,10 @@ class AuthClient:
         user_id = hash_api_key(api_key)
 
         try:
-            user_doc = self._get_user_ref(user_id).get()
+            user_doc = self._get_user_ref(user_id).get(field_paths=_EXISTS_ONLY)
             if user_doc.exists:
-                logger.debug("API key validated for user: %s", user_id[:8])
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("API key validated for user: %s", user_id[:8])
                 return user_id
             else:
                 logger.warning("API key not found in database")
@@ -153,13 +190,23 @@ class AuthClient:
     def user_exists(self, user_id: str) -> bool:
         """Check if a user exists.
 
+        Positive answers are cached in-process for a few minutes, since this
+        runs on every MCP request. Misses are never cached.
+
         Args:
             user_id: The user's ID
 
         Returns:
             True if user exists
         """
+        if self._is_known_user(user_id):
+            return True
+
         try:
-            return self._get_user_ref(user_id).get().exists
+            exists = self._get_user_ref(user_id).get(field_paths=_EXISTS_ONLY).exists
         except Exception:
             return False
+
+        if exists:
+            self._remember_user(user_id)
+        return exists
@@ -5,17 +5,99 @@ All I/O is contained here; business logic is in the core module.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from datetime import date, timedelta
+from typing import Any, Callable
 
+from google.api_core.exceptions import FailedPrecondition
 from google.cloud import firestore
+from pydantic import ValidationError
 
 from ..core.models import UserSettings, FoodEntry, DailyLog, CachedFood
 
 
 logger = logging.getLogger(__name__)
 
+# Settings rarely change within a session; serve them from memory for a while
+_SETTINGS_TTL = 300
+_SETTINGS_CACHE_MAX_ENTRIES = 1024
+
+# Document references kept per reference kind
+_REF_CACHE_MAX_ENTRIES = 4096
+
+# Log fields fetched by get_logs_range
+_LOG_RANGE_FIELDS = ["log_date", "entries"]
+
+# Maximum cached foods read per search query
+_CACHE_SEARCH_LIMIT = 20
+
+# Bumped when the search fields on cached foods change, so existing caches
+# are backfilled with the new ones
+_CACHE_SEARCH_VERSION = 2
+
+# Users whose cached foods are known to have the current search fields
+_INDEXED_CACHES_MAX_ENTRIES = 4096
+
+# Firestore's limit on writes per batch
+_BATCH_MAX_WRITES = 500
+
+
+def _log_from_dict(data: dict[str, Any]) -> DailyLog:
+    """Build a DailyLog from a stored log document.
+
+    Stored logs were validated when they were written, so they are rebuilt
+    with model_construct instead of being validated again on every read.
+    """
+    # Convert entries from dicts to FoodEntry objects
+    data["entries"] = [FoodEntry.model_construct(**e) for e in data.get("entries", [])]
+    # Parse date string back to date object
+    if isinstance(data.get("log_date"), str):
+        data["log_date"] = date.fromisoformat(data["log_date"])
+    return DailyLog.model_construct(**data)
+
+
+def _cache_search_fields(name: str) -> dict[str, Any]:
+    """Search keys that let search_cache match a food with one indexed query.
+
+    name_prefixes holds every prefix of the lowercased name, and of each part
+    of it that starts at a word, so "gre", "greek sal" and "salad" all match
+    "Greek Salad".
+    """
+    words = name.lower().split()
+    prefixes = set()
+    for i in range(len(words)):
+        tail = " ".join(words[i:])
+        prefixes.update(tail[:n] for n in range(1, len(tail) + 1))
+    return {"name_prefixes": sorted(prefixes)}
+
+
+def _log_to_dict(
+    log: DailyLog, stored: dict[str, tuple[FoodEntry, dict[str, Any]]] | None = None
+) -> dict[str, Any]:
+    """Serialize a DailyLog into a log document.
+
+    Args:
+        log: The log to serialize
+        stored: Entries read from the log document, keyed by entry ID, with
+            the dict each was read from; entries still in the log unchanged
+            are written back as stored instead of being dumped again
+    """
+    stored = stored or {}
+    data = log.model_dump(exclude={"entries"})
+    data["entries"] = []
+    for entry in log.entries:
+        read = stored.get(entry.id)
+        data["entries"].append(read[1] if read is not None and read[0] is entry else entry.model_dump())
+    # Filled in by Firestore when the write commits
+    data["updated_at"] = firestore.SERVER_TIMESTAMP
+    # Convert date to ISO string for JSON serialization
+    data["log_date"] = log.log_date.isoformat()
+    return data
+
 
 @dataclass
 class FirestoreConfig:
@@ -48,6 +130,17 @@ class FoodLogFirestoreClient:
         """
         self.config = config or FirestoreConfig()
         self._client: firestore.Client | None = None
+        # user_id -> (expiry in monotonic seconds, settings), most recently used last
+        self._settings_cache: OrderedDict[str, tuple[float, UserSettings]] = OrderedDict()
+        self._settings_cache_lock = threading.Lock()
+        # Users whose cache has been backfilled, most recently used last
+        self._indexed_caches: OrderedDict[str, None] = OrderedDict()
+        self._indexed_caches_lock = threading.Lock()
+        # Document references never change, so build each one only once
+        self._user_ref = lru_cache(maxsize=_REF_CACHE_MAX_ENTRIES)(self._user_ref)
+        self._settings_ref = lru_cache(maxsize=_REF_CACHE_MAX_ENTRIES)(self._settings_ref)
+        self._log_ref = lru_cache(maxsize=_REF_CACHE_MAX_ENTRIES)(self._log_ref)
+        self._cache_ref = lru_cache(maxsize=_REF_CACHE_MAX_ENTRIES)(self._cache_ref)
 
     @property
     def client(self) -> firestore.Client:
@@ -80,21 +173,52 @@ class FoodLogFirestoreClient:
 
     # ==================== Settings Operations ====================
 
+    def _cached_settings(self, user_id: str) -> UserSettings | None:
+        """Return settings cached within the TTL, if any."""
+        with self._settings_cache_lock:
+            cached = self._settings_cache.get(user_id)
+            if cached is None:
+                return None
+            expires_at, settings = cached
+            if expires_at <= time.monotonic():
+                del self._settings_cache[user_id]
+                return None
+            self._settings_cache.move_to_end(user_id)
+            return settings
+
+    def _cache_settings(self, user_id: str, settings: UserSettings) -> None:
+        """Store settings in the cache, evicting the least recently used."""
+        with self._settings_cache_lock:
+            self._settings_cache[user_id] = (time.monotonic() + _SETTINGS_TTL, settings)
+            self._settings_cache.move_to_end(user_id)
+            if len(self._settings_cache) > _SETTINGS_CACHE_MAX_ENTRIES:
+                self._settings_cache.popitem(last=False)
+
     def get_settings(self, user_id: str) -> UserSettings | None:
         """Fetch user settings.
 
+        Served from an in-process cache for a few minutes after each read or
+        save, since every tool call needs them.
+
         Args:
             user_id: The user's ID
 
         Returns:
             UserSettings if found, None otherwise
         """
-        logger.debug("Fetching settings for user: %s", user_id[:8])
+        settings = self._cached_settings(user_id)
+        if settings is not None:
+            return settings
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching settings for user: %s", user_id[:8])
         try:
             doc = self._settings_ref(user_id).get()
             if not doc.exists:
                 return None
-            return UserSettings(**doc.to_dict())
+            settings = UserSettings(**doc.to_dict())
+            self._cache_settings(user_id, settings)
+            return settings
         except Exception as e:
             logger.error("Failed to fetch settings: %s", str(e))
             return None
@@ -112,13 +236,48 @@ class FoodLogFirestoreClient:
         logger.info("Saving settings for user: %s", user_id[:8])
         try:
             data = settings.model_dump()
-            data["updated_at"] = datetime.utcnow()
+            data["updated_at"] = firestore.SERVER_TIMESTAMP
             self._settings_ref(user_id).set(data)
+            self._cache_settings(user_id, settings)
             return True
         except Exception as e:
             logger.error("Failed to save settings: %s", str(e))
             return False
 
+    def _read_log_and_settings(
+        self,
+        user_id: str,
+        log_ref: firestore.DocumentReference,
+        transaction: firestore.Transaction | None = None,
+    ) -> tuple[firestore.DocumentSnapshot, UserSettings | None]:
+        """Read a log document along with the user's settings.
+
+        Settings come from the cache when possible; otherwise both documents
+        are fetched in one batched get and the settings are cached, so the
+        summary that follows a log change doesn't cost another round trip.
+
+        Args:
+            user_id: The user's ID
+            log_ref: Reference to the daily log document
+            transaction: Transaction to read in, if any
+
+        Returns:
+            Tuple of (log snapshot, settings or None if not configured)
+        """
+        settings = self._cached_settings(user_id)
+        if settings is not None:
+            return log_ref.get(transaction=transaction), settings
+
+        settings_ref = self._settings_ref(user_id)
+        log_snapshot = None
+        for snapshot in self.client.get_all([log_ref, settings_ref], transaction=transaction):
+            if snapshot.reference.path != settings_ref.path:
+                log_snapshot = snapshot
+            elif snapshot.exists:
+                settings = UserSettings(**snapshot.to_dict())
+                self._cache_settings(user_id, settings)
+        return log_snapshot, settings
+
     # ==================== Daily Log Operations ====================
 
     def get_log(self, user_id: str, log_date: date) -> DailyLog | None:
@@ -131,19 +290,41 @@ class FoodLogFirestoreClient:
         Returns:
             DailyLog if found, None otherwise
         """
-        logger.debug("Fetching log for %s on %s", user_id[:8], log_date)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching log for %s on %s", user_id[:8], log_date)
         try:
             doc = self._log_ref(user_id, log_date).get()
             if not doc.exists:
                 return None
-            data = doc.to_dict()
-            # Convert entries from dicts to FoodEntry objects
-            data["entries"] = [FoodEntry(**e) for e in data.get("entries", [])]
-            return DailyLog(**data)
+            return _log_from_dict(doc.to_dict())
         except Exception as e:
             logger.error("Failed to fetch log: %s", str(e))
             return None
 
+    def get_log_and_settings(
+        self, user_id: str, log_date: date
+    ) -> tuple[DailyLog | None, UserSettings | None]:
+        """Fetch a daily log and the user's settings together.
+
+        Args:
+            user_id: The user's ID
+            log_date: Date of the log
+
+        Returns:
+            Tuple of (DailyLog or None, UserSettings or None)
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching log and settings for %s on %s", user_id[:8], log_date)
+        try:
+            snapshot, settings = self._read_log_and_settings(
+                user_id, self._log_ref(user_id, log_date)
+            )
+            log = _log_from_dict(snapshot.to_dict()) if snapshot.exists else None
+            return log, settings
+        except Exception as e:
+            logger.error("Failed to fetch log and settings: %s", str(e))
+            return None, None
+
     def save_log(self, user_id: str, log: DailyLog) -> bool:
         """Save a daily log.
 
@@ -156,11 +337,7 @@ class FoodLogFirestoreClient:
         """
         logger.info("Saving log for %s on %s", user_id[:8], log.log_date)
         try:
-            data = log.model_dump()
-            data["updated_at"] = datetime.utcnow()
-            # Convert date to ISO string for JSON serialization
-            data["log_date"] = log.log_date.isoformat()
-            self._log_ref(user_id, log.log_date).set(data)
+            self._log_ref(user_id, log.log_date).set(_log_to_dict(log))
             return True
         except Exception as e:
             logger.error("Failed to save log: %s", str(e))
@@ -179,34 +356,92 @@ class FoodLogFirestoreClient:
         Returns:
             List of DailyLogs found (may be empty)
         """
-        logger.debug(
-            "Fetching logs for %s from %s to %s", user_id[:8], start_date, end_date
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Fetching logs for %s from %s to %s", user_id[:8], start_date, end_date
+            )
         logs: list[DailyLog] = []
 
         try:
-            # Query logs collection for date range
-            logs_ref = self._user_ref(user_id).collection("logs")
-            query = (
-                logs_ref.where("log_date", ">=", start_date.isoformat())
-                .where("log_date", "<=", end_date.isoformat())
-                .order_by("log_date")
-            )
-
-            for doc in query.stream():
-                data = doc.to_dict()
-                data["entries"] = [FoodEntry(**e) for e in data.get("entries", [])]
-                # Parse date string back to date object
-                if isinstance(data.get("log_date"), str):
-                    data["log_date"] = date.fromisoformat(data["log_date"])
-                logs.append(DailyLog(**data))
-
-            logger.debug("Found %d logs in range", len(logs))
+            # Log documents are keyed by date, so fetch every day in the range
+            # with one batched get instead of running a range query
+            days = (end_date - start_date).days + 1
+            refs = [self._log_ref(user_id, start_date + timedelta(days=i)) for i in range(days)]
+
+            # Range readers only need the entries, not the log's timestamps
+            for snapshot in self.client.get_all(refs, field_paths=_LOG_RANGE_FIELDS):
+                if snapshot.exists:
+                    logs.append(_log_from_dict(snapshot.to_dict()))
+
+            # get_all does not preserve the order of the references
+            logs.sort(key=lambda log: log.log_date)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Found %d logs in range", len(logs))
             return logs
         except Exception as e:
             logger.error("Failed to fetch logs range: %s", str(e))
             return []
 
+    def _update_log(
+        self,
+        user_id: str,
+        log_date: date,
+        mutate: Callable[[DailyLog], DailyLog | None],
+        create_missing: bool = False,
+    ) -> DailyLog | None:
+        """Apply a change to a daily log inside a Firestore transaction.
+
+        The read and the write commit atomically, so parallel tool calls can't
+        overwrite each other's entries. Firestore reruns the transaction on
+        contention, so mutate must only build on the log it is given. Uncached
+        settings are read in the same call and cached for the caller.
+
+        Args:
+            user_id: The user's ID
+            log_date: Date of the log
+            mutate: Returns the changed log as a new DailyLog, or the log it
+                was given if nothing changed (returned without a write).
+                Returning None aborts (e.g. when the entry to change doesn't
+                exist)
+            create_missing: Start from an empty log if none exists yet
+
+        Returns:
+            Updated DailyLog if successful, None otherwise
+
+        Raises:
+            ValidationError: If mutate builds an invalid entry
+        """
+        log_ref = self._log_ref(user_id, log_date)
+
+        @firestore.transactional
+        def apply(transaction: firestore.Transaction) -> DailyLog | None:
+            snapshot, _ = self._read_log_and_settings(user_id, log_ref, transaction)
+            stored = {}
+            if snapshot.exists:
+                data = snapshot.to_dict()
+                stored_entries = data.get("entries", [])
+                log = _log_from_dict(data)
+                stored = {e.id: (e, raw) for e, raw in zip(log.entries, stored_entries)}
+            elif create_missing:
+                log = DailyLog(log_date=log_date, entries=[])
+            else:
+                return None
+
+            updated = mutate(log)
+            if updated is not None and updated is not log:
+                transaction.set(log_ref, _log_to_dict(updated, stored))
+            return updated
+
+        logger.info("Updating log for %s on %s", user_id[:8], log_date)
+        try:
+            return apply(self.client.transaction())
+        except ValidationError:
+            # Invalid input from the caller, not a storage failure
+            raise
+        except Exception as e:
+            logger.error("Failed to update log: %s", str(e))
+            return None
+
     def add_entry(self, user_id: str, entry: FoodEntry, log_date: date | None = None) -> DailyLog | None:
         """Add a food entry to a day's log.
 
@@ -215,21 +450,31 @@ class FoodLogFirestoreClient:
             entry: The food entry to add
             log_date: Date for the entry (defaults to today)
 
+        Returns:
+            Updated DailyLog if successful, None otherwise
+        """
+        return self.add_entries(user_id, [entry], log_date)
+
+    def add_entries(
+        self, user_id: str, entries: list[FoodEntry], log_date: date | None = None
+    ) -> DailyLog | None:
+        """Add several food entries to a day's log in one transaction.
+
+        Args:
+            user_id: The user's ID
+            entries: The food entries to add
+            log_date: Date for the entries (defaults to today)
+
         Returns:
             Updated DailyLog if successful, None otherwise
         """
         if log_date is None:
             log_date = date.today()
 
-        log = self.get_log(user_id, log_date)
-        if log is None:
-            log = DailyLog(log_date=log_date, entries=[])
-
-        log.entries.append(entry)
+        def append(log: DailyLog) -> DailyLog:
+            return log.model_copy(update={"entries": [*log.entries, *entries]})
 
-        if self.save_log(user_id, log):
-            return log
-        return None
+        return self._update_log(user_id, log_date, append, create_missing=True)
 
     def update_entry(
         self, user_id: str, entry_id: str, updates: dict, log_date: date | None = None
@@ -244,34 +489,40 @@ class FoodLogFirestoreClient:
 
         Returns:
             Updated DailyLog if successful, None otherwise
+
+        Raises:
+            ValidationError: If the updates make the entry invalid
         """
         if log_date is None:
             log_date = date.today()
 
-        log = self.get_log(user_id, log_date)
-        if log is None:
-            return None
-
-        for i, entry in enumerate(log.entries):
-            if entry.id == entry_id:
-                # Create updated entry
-                entry_data = entry.model_dump()
-                entry_data.update(updates)
-                log.entries[i] = FoodEntry(**entry_data)
-                break
-        else:
+        def apply_updates(log: DailyLog) -> DailyLog | None:
+            for i, entry in enumerate(log.entries):
+                if entry.id == entry_id:
+                    # Nothing to write if every field already has its new value
+                    if all(getattr(entry, k, None) == v for k, v in updates.items()):
+                        return log
+                    # Create updated entry
+                    entry_data = entry.model_dump()
+                    entry_data.update(updates)
+                    entries = list(log.entries)
+                    entries[i] = FoodEntry(**entry_data)
+                    return log.model_copy(update={"entries": entries})
             logger.warning("Entry not found: %s", entry_id)
             return None
 
-        if self.save_log(user_id, log):
-            return log
-        return None
+        return self._update_log(user_id, log_date, apply_updates)
 
     def delete_entry(
         self, user_id: str, entry_id: str, log_date: date | None = None
     ) -> DailyLog | None:
         """Delete a food entry.
 
+        The stored entry is removed server-side with ArrayRemove, so only that
+        element is sent instead of rewriting the whole log. The write only
+        applies if the log hasn't changed since it was read; otherwise the
+        delete is retried in a transaction.
+
         Args:
             user_id: The user's ID
             entry_id: ID of the entry to delete
@@ -283,53 +534,147 @@ class FoodLogFirestoreClient:
         if log_date is None:
             log_date = date.today()
 
-        log = self.get_log(user_id, log_date)
-        if log is None:
-            return None
+        log_ref = self._log_ref(user_id, log_date)
+        try:
+            doc, _ = self._read_log_and_settings(user_id, log_ref)
+            if not doc.exists:
+                return None
+            data = doc.to_dict()
+            stored_entries = data.get("entries", [])
 
-        original_count = len(log.entries)
-        log.entries = [e for e in log.entries if e.id != entry_id]
+            # Use the element exactly as stored so ArrayRemove matches it
+            removed = next((e for e in stored_entries if e.get("id") == entry_id), None)
+            if removed is None:
+                logger.warning("Entry not found: %s", entry_id)
+                return None
 
-        if len(log.entries) == original_count:
-            logger.warning("Entry not found: %s", entry_id)
+            log_ref.update(
+                {
+                    "entries": firestore.ArrayRemove([removed]),
+                    "updated_at": firestore.SERVER_TIMESTAMP,
+                },
+                option=self.client.write_option(last_update_time=doc.update_time),
+            )
+        except FailedPrecondition:
+            # The log changed after it was read (e.g. the entry was edited)
+            logger.info("Log changed during delete, retrying in a transaction")
+
+            def remove(log: DailyLog) -> DailyLog | None:
+                entries = [e for e in log.entries if e.id != entry_id]
+                if len(entries) == len(log.entries):
+                    logger.warning("Entry not found: %s", entry_id)
+                    return None
+                return log.model_copy(update={"entries": entries})
+
+            return self._update_log(user_id, log_date, remove)
+        except Exception as e:
+            logger.error("Failed to delete entry: %s", str(e))
             return None
 
-        if self.save_log(user_id, log):
-            return log
-        return None
+        data["entries"] = [e for e in stored_entries if e is not removed]
+        return _log_from_dict(data)
 
     # ==================== Cache Operations ====================
 
-    def search_cache(self, user_id: str, query: str) -> list[CachedFood]:
+    def search_cache(
+        self, user_id: str, query: str, cursor: str | None = None
+    ) -> tuple[list[CachedFood], str | None]:
         """Search user's food cache.
 
-        Simple case-insensitive substring match on name.
+        Case-insensitive match on names that start with the query, or contain
+        it from the start of a word. Matches come most used first from a single
+        query, so pages never repeat a food; pass the returned cursor (the last
+        document's ID) back to get the next page.
 
         Args:
             user_id: The user's ID
             query: Search query
+            cursor: Cursor from a previous search (None for the first page)
 
         Returns:
-            List of matching cached foods
+            Tuple of (matching cached foods, most used first; cursor for the
+            next page or None if there are no more)
         """
-        logger.debug("Searching cache for %s: %s", user_id[:8], query)
-        results: list[CachedFood] = []
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Searching cache for %s: %s", user_id[:8], query)
+        self._ensure_cache_search_fields(user_id)
+        cache_ref = self._user_ref(user_id).collection("cache")
+        query_lower = " ".join(query.lower().split())
 
         try:
-            cache_ref = self._user_ref(user_id).collection("cache")
-            query_lower = query.lower()
+            if query_lower:
+                search = cache_ref.where(
+                    filter=firestore.FieldFilter("name_prefixes", "array_contains", query_lower)
+                ).order_by("use_count", direction=firestore.Query.DESCENDING)
+            else:
+                search = cache_ref.order_by("use_count", direction=firestore.Query.DESCENDING)
+            if cursor is not None:
+                # Resume from the snapshot so Firestore also orders by document
+                # ID; equal use counts at the page boundary are not skipped
+                last_doc = cache_ref.document(cursor).get()
+                if not last_doc.exists:
+                    logger.warning("Cache search cursor not found: %s", cursor)
+                    return [], None
+                search = search.start_after(last_doc)
+            docs = list(search.limit(_CACHE_SEARCH_LIMIT).stream())
+        except Exception as e:
+            logger.error("Failed to search cache: %s", str(e))
+            return [], None
+
+        next_cursor = docs[-1].id if len(docs) == _CACHE_SEARCH_LIMIT else None
+        return [CachedFood(**doc.to_dict()) for doc in docs], next_cursor
 
-            # Firestore doesn't support case-insensitive search,
-            # so we fetch all and filter in memory (acceptable for small caches)
-            for doc in cache_ref.order_by("use_count", direction=firestore.Query.DESCENDING).limit(100).stream():
-                food = CachedFood(**doc.to_dict())
-                if query_lower in food.name.lower():
-                    results.append(food)
+    def _ensure_cache_search_fields(self, user_id: str) -> None:
+        """Backfill the search fields on foods cached before they existed.
+
+        Runs once per user and search field version: the user document records
+        the version when the backfill is done, and users already on it are
+        remembered so later searches skip the check.
+
+        Args:
+            user_id: The user's ID
+        """
+        with self._indexed_caches_lock:
+            if user_id in self._indexed_caches:
+                self._indexed_caches.move_to_end(user_id)
+                return
 
-            return results
+        user_ref = self._user_ref(user_id)
+        try:
+            user_doc = user_ref.get(field_paths=["cache_search_version"])
+            version = user_doc.to_dict().get("cache_search_version", 0) if user_doc.exists else 0
+            if version < _CACHE_SEARCH_VERSION:
+                self._backfill_cache_search_fields(user_id)
+                user_ref.set({"cache_search_version": _CACHE_SEARCH_VERSION}, merge=True)
         except Exception as e:
-            logger.error("Failed to search cache: %s", str(e))
-            return []
+            # Left unmarked, so the next search tries again
+            logger.error("Failed to backfill cache search fields: %s", str(e))
+            return
+
+        with self._indexed_caches_lock:
+            self._indexed_caches[user_id] = None
+            if len(self._indexed_caches) > _INDEXED_CACHES_MAX_ENTRIES:
+                self._indexed_caches.popitem(last=False)
+
+    def _backfill_cache_search_fields(self, user_id: str) -> None:
+        """Write the search fields to every cached food missing them."""
+        cache_ref = self._user_ref(user_id).collection("cache")
+        batch = self.client.batch()
+        pending = backfilled = 0
+        for doc in cache_ref.select(["name", "name_prefixes"]).stream():
+            data = doc.to_dict()
+            if "name_prefixes" in data:
+                continue
+            batch.update(doc.reference, _cache_search_fields(data["name"]))
+            pending += 1
+            backfilled += 1
+            if pending == _BATCH_MAX_WRITES:
+                batch.commit()
+                batch = self.client.batch()
+                pending = 0
+        if pending:
+            batch.commit()
+        logger.info("Backfilled search fields on %d cached foods for %s", backfilled, user_id[:8])
 
     def add_to_cache(self, user_id: str, food: CachedFood) -> bool:
         """Add a food to the user's cache.
@@ -343,7 +688,9 @@ class FoodLogFirestoreClient:
         """
         logger.info("Adding to cache for %s: %s", user_id[:8], food.name)
         try:
-            self._cache_ref(user_id, food.id).set(food.model_dump())
+            data = food.model_dump()
+            data.update(_cache_search_fields(food.name))
+            self._cache_ref(user_id, food.id).set(data)
             return True
         except Exception as e:
             logger.error("Failed to add to cache: %s", str(e))
@@ -362,7 +709,7 @@ class FoodLogFirestoreClient:
         try:
             self._cache_ref(user_id, food_id).update({
                 "use_count": firestore.Increment(1),
-                "last_used": datetime.utcnow(),
+                "last_used": firestore.SERVER_TIMESTAMP,
             })
             return True
         except Exception as e:
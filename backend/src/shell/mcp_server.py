@@ -6,13 +6,15 @@ Handles authentication via API key in Authorization header.
 
 import logging
 import os
+import threading
 from contextvars import ContextVar
 from datetime import date, timedelta
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
+from pydantic import ValidationError
 
-from ..core.models import UserSettings, FoodEntry, CachedFood, DailyLog
+from ..core.models import UserSettings, FoodEntry, FoodEntryInput, CachedFood, DailyLog
 from ..core.macros import calculate_daily_summary
 from ..core.reports import generate_weekly_report
 from .firestore_client import FoodLogFirestoreClient, FirestoreConfig
@@ -54,19 +56,28 @@ After logging, always show the updated daily summary.""",
     transport_security=transport_security,
 )
 
+# Entry fields returned by the day views
+_ENTRY_FIELDS = frozenset({"id", "name", "description", "calories", "protein", "carbs", "fat"})
+
+# Entry fields echoed back after logging food
+_CREATED_ENTRY_FIELDS = frozenset({"id", "name", "calories", "protein", "carbs", "fat"})
+
 # Lazy-initialized clients
 _firestore_client: FoodLogFirestoreClient | None = None
 _auth_client: AuthClient | None = None
+_clients_lock = threading.Lock()
 
 
 def get_firestore_client() -> FoodLogFirestoreClient:
     """Get or create Firestore client."""
     global _firestore_client
     if _firestore_client is None:
-        config = FirestoreConfig(
-            database=os.environ.get("FIRESTORE_DATABASE", "foodlogr"),
-        )
-        _firestore_client = FoodLogFirestoreClient(config)
+        with _clients_lock:
+            if _firestore_client is None:
+                config = FirestoreConfig(
+                    database=os.environ.get("FIRESTORE_DATABASE", "foodlogr"),
+                )
+                _firestore_client = FoodLogFirestoreClient(config)
     return _firestore_client
 
 
@@ -74,10 +85,29 @@ def get_auth_client() -> AuthClient:
     """Get or create Auth client."""
     global _auth_client
     if _auth_client is None:
-        _auth_client = AuthClient(get_firestore_client().client)
+        db = get_firestore_client()
+        with _clients_lock:
+            if _auth_client is None:
+                _auth_client = AuthClient(db.client)
     return _auth_client
 
 
+def warm_up_clients() -> None:
+    """Create the clients and open the Firestore channel before the first request.
+
+    Credential discovery and the first gRPC handshake otherwise land on the
+    first request a new instance serves. Failures are only logged; the clients
+    are created lazily on demand as usual.
+    """
+    try:
+        db = get_firestore_client()
+        get_auth_client()
+        list(db.client.collection("_warmup").limit(1).stream())
+        logger.info("Firestore client warmed up")
+    except Exception as e:
+        logger.warning("Firestore warm-up failed: %s", str(e))
+
+
 def get_user_id() -> str:
     """Get current authenticated user ID.
 
@@ -210,14 +240,46 @@ def log_food(
     summary = calculate_daily_summary(log.entries, settings)
 
     return {
-        "entry": {
-            "id": entry.id,
-            "name": entry.name,
-            "calories": entry.calories,
-            "protein": entry.protein,
-            "carbs": entry.carbs,
-            "fat": entry.fat,
-        },
+        "entry": entry.model_dump(include=_CREATED_ENTRY_FIELDS),
+        "daily_summary": summary.model_dump(),
+    }
+
+
+@mcp.tool()
+def log_foods(entries: list[FoodEntryInput]) -> dict:
+    """Add several food entries to today's log at once (e.g. a whole meal).
+
+    Args:
+        entries: Foods to log, each with name, calories, protein, carbs, fat
+            and an optional description (same fields as log_food)
+
+    Returns:
+        The created entries with IDs and updated daily summary
+    """
+    user_id = get_user_id()
+    db = get_firestore_client()
+
+    if not entries:
+        return {"error": "No entries to log."}
+    foods = [FoodEntry(**item.model_dump()) for item in entries]
+
+    log = db.add_entries(user_id, foods)
+    if log is None:
+        return {"error": "Failed to log foods. Please try again."}
+
+    created = [entry.model_dump(include=_CREATED_ENTRY_FIELDS) for entry in foods]
+
+    settings = db.get_settings(user_id)
+    if settings is None:
+        return {
+            "entries": created,
+            "warning": "No settings configured. Use setup_user to see remaining goals.",
+        }
+
+    summary = calculate_daily_summary(log.entries, settings)
+
+    return {
+        "entries": created,
         "daily_summary": summary.model_dump(),
     }
 
@@ -266,7 +328,10 @@ def update_food(
     if not updates:
         return {"error": "No updates provided."}
 
-    log = db.update_entry(user_id, entry_id, updates)
+    try:
+        log = db.update_entry(user_id, entry_id, updates)
+    except ValidationError as e:
+        return {"error": f"Invalid update: {e}"}
     if log is None:
         return {"error": "Entry not found or update failed."}
 
@@ -329,24 +394,12 @@ def get_today() -> dict:
     db = get_firestore_client()
 
     today = date.today()
-    log = db.get_log(user_id, today)
+    log, settings = db.get_log_and_settings(user_id, today)
 
     entries = []
     if log:
-        entries = [
-            {
-                "id": e.id,
-                "name": e.name,
-                "description": e.description,
-                "calories": e.calories,
-                "protein": e.protein,
-                "carbs": e.carbs,
-                "fat": e.fat,
-            }
-            for e in log.entries
-        ]
+        entries = [e.model_dump(include=_ENTRY_FIELDS) for e in log.entries]
 
-    settings = db.get_settings(user_id)
     if settings is None:
         return {
             "date": today.isoformat(),
@@ -388,24 +441,12 @@ def get_day(date_str: str) -> dict:
     except ValueError:
         return {"error": "Invalid date format. Use YYYY-MM-DD."}
 
-    log = db.get_log(user_id, log_date)
+    log, settings = db.get_log_and_settings(user_id, log_date)
 
     entries = []
     if log:
-        entries = [
-            {
-                "id": e.id,
-                "name": e.name,
-                "description": e.description,
-                "calories": e.calories,
-                "protein": e.protein,
-                "carbs": e.carbs,
-                "fat": e.fat,
-            }
-            for e in log.entries
-        ]
+        entries = [e.model_dump(include=_ENTRY_FIELDS) for e in log.entries]
 
-    settings = db.get_settings(user_id)
     if settings is None:
         return {
             "date": date_str,
@@ -453,6 +494,8 @@ def get_weekly_report() -> dict:
 
     logs = db.get_logs_range(user_id, start_date, end_date)
     report = generate_weekly_report(logs, settings, start_date)
+    # model_dump applies the report's output rounding
+    data = report.model_dump()
 
     return {
         "week_start": report.week_start.isoformat(),
@@ -460,22 +503,22 @@ def get_weekly_report() -> dict:
         "days_logged": report.days_logged,
         "daily_summaries": [
             {
-                "date": s.log_date.isoformat(),
-                "calories": s.total_calories,
-                "protein": s.total_protein,
-                "carbs": s.total_carbs,
-                "fat": s.total_fat,
-                "entry_count": s.entry_count,
+                "date": s["log_date"].isoformat(),
+                "calories": s["total_calories"],
+                "protein": s["total_protein"],
+                "carbs": s["total_carbs"],
+                "fat": s["total_fat"],
+                "entry_count": s["entry_count"],
             }
-            for s in report.daily_summaries
+            for s in data["daily_summaries"]
         ],
         "weekly_totals": {
-            "calories": report.total_calories,
-            "protein": report.total_protein,
-            "carbs": report.total_carbs,
-            "fat": report.total_fat,
+            "calories": data["total_calories"],
+            "protein": data["total_protein"],
+            "carbs": data["total_carbs"],
+            "fat": data["total_fat"],
         },
-        "avg_daily_calories": report.avg_daily_calories,
+        "avg_daily_calories": data["avg_daily_calories"],
         "fat_added": report.fat_added,
         "interpretation": (
             f"Caloric {'surplus' if report.fat_added > 0 else 'deficit'} "
@@ -488,33 +531,38 @@ def get_weekly_report() -> dict:
 
 
 @mcp.tool()
-def search_cache(query: str) -> list[dict]:
+def search_cache(query: str, cursor: str | None = None) -> dict:
     """Search user's frequently used foods cache.
 
     Args:
         query: Search term to match against food names
+        cursor: next_cursor from a previous search to get more results
 
     Returns:
-        List of matching cached foods with their macro values
+        Matching cached foods with their macro values, most used first, and
+        a next_cursor when more results are available
     """
     user_id = get_user_id()
     db = get_firestore_client()
 
-    results = db.search_cache(user_id, query)
-
-    return [
-        {
-            "id": f.id,
-            "name": f.name,
-            "description": f.description,
-            "calories": f.calories,
-            "protein": f.protein,
-            "carbs": f.carbs,
-            "fat": f.fat,
-            "use_count": f.use_count,
-        }
-        for f in results
-    ]
+    results, next_cursor = db.search_cache(user_id, query, cursor)
+
+    return {
+        "foods": [
+            {
+                "id": f.id,
+                "name": f.name,
+                "description": f.description,
+                "calories": f.calories,
+                "protein": f.protein,
+                "carbs": f.carbs,
+                "fat": f.fat,
+                "use_count": f.use_count,
+            }
+            for f in results
+        ],
+        "next_cursor": next_cursor,
+    }
 
 
 @mcp.tool()
@@ -0,0 +1,24 @@
+"""Shared fixtures for core tests."""
+
+import pytest
+
+from src.core.models import FoodEntry, UserSettings
+
+
+@pytest.fixture(scope="module")
+def default_settings():
+    """Standard goals used across tests; models are never mutated, so shared."""
+    return UserSettings(
+        calorie_goal=2000,
+        protein_goal=150,
+        carb_goal=200,
+        resting_energy=1800,
+    )
+
+
+@pytest.fixture
+def make_entry():
+    """Build FoodEntry test data without re-running validation."""
+    def make(**fields) -> FoodEntry:
+        return FoodEntry.model_construct(**fields)
+    return make
@@ -1,6 +1,6 @@
 """Unit tests for macro calculations - pure functions, no mocks needed."""
 
-from src.core.models import FoodEntry, UserSettings
+from src.core.models import UserSettings
 from src.core.macros import (
     calculate_daily_totals,
     calculate_daily_summary,
@@ -16,9 +16,9 @@ class TestCalculateDailyTotals:
         totals = calculate_daily_totals([])
         assert totals == (0, 0, 0, 0)
 
-    def test_single_entry(self):
+    def test_single_entry(self, make_entry):
         """Single entry returns its values."""
-        entry = FoodEntry(
+        entry = make_entry(
             name="Coffee",
             calories=65,
             protein=4.0,
@@ -28,12 +28,12 @@ class TestCalculateDailyTotals:
         totals = calculate_daily_totals([entry])
         assert totals == (65, 4.0, 6.5, 2.5)
 
-    def test_multiple_entries(self):
+    def test_multiple_entries(self, make_entry):
         """Multiple entries are summed correctly."""
         entries = [
-            FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5),
-            FoodEntry(name="Eggs", calories=140, protein=12, carbs=0, fat=10),
-            FoodEntry(name="Bread", calories=120, protein=3, carbs=20, fat=3),
+            make_entry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5),
+            make_entry(name="Eggs", calories=140, protein=12, carbs=0, fat=10),
+            make_entry(name="Bread", calories=120, protein=3, carbs=20, fat=3),
         ]
         totals = calculate_daily_totals(entries)
         assert totals == (325, 19.0, 26.5, 15.5)
@@ -42,58 +42,40 @@ class TestCalculateDailyTotals:
 class TestCalculateDailySummary:
     """Tests for calculate_daily_summary."""
 
-    def test_empty_day_shows_full_remaining(self):
+    def test_empty_day_shows_full_remaining(self, default_settings):
         """Empty day shows all goals as remaining."""
-        settings = UserSettings(
-            calorie_goal=2000,
-            protein_goal=150,
-            carb_goal=200,
-            resting_energy=1800,
-        )
-        summary = calculate_daily_summary([], settings)
+        summary = calculate_daily_summary([], default_settings)
 
         assert summary.total_calories == 0
         assert summary.calories_remaining == 2000
         assert summary.protein_remaining == 150
         assert summary.carbs_remaining == 200
 
-    def test_partial_day_shows_correct_remaining(self):
+    def test_partial_day_shows_correct_remaining(self, default_settings, make_entry):
         """Partial day shows correct remaining amounts."""
-        settings = UserSettings(
-            calorie_goal=2000,
-            protein_goal=150,
-            carb_goal=200,
-            resting_energy=1800,
-        )
         entries = [
-            FoodEntry(name="Breakfast", calories=500, protein=30, carbs=50, fat=20),
+            make_entry(name="Breakfast", calories=500, protein=30, carbs=50, fat=20),
         ]
-        summary = calculate_daily_summary(entries, settings)
+        summary = calculate_daily_summary(entries, default_settings)
 
         assert summary.total_calories == 500
         assert summary.calories_remaining == 1500
         assert summary.protein_remaining == 120
         assert summary.carbs_remaining == 150
 
-    def test_over_goal_shows_negative_remaining(self):
+    def test_over_goal_shows_negative_remaining(self, default_settings, make_entry):
         """Going over goal shows negative remaining."""
-        settings = UserSettings(
-            calorie_goal=2000,
-            protein_goal=150,
-            carb_goal=200,
-            resting_energy=1800,
-        )
         entries = [
-            FoodEntry(name="Big meal", calories=2500, protein=200, carbs=250, fat=100),
+            make_entry(name="Big meal", calories=2500, protein=200, carbs=250, fat=100),
         ]
-        summary = calculate_daily_summary(entries, settings)
+        summary = calculate_daily_summary(entries, default_settings)
 
         assert summary.total_calories == 2500
         assert summary.calories_remaining == -500
         assert summary.protein_remaining == -50
         assert summary.carbs_remaining == -50
 
-    def test_fat_goal_when_set(self):
+    def test_fat_goal_when_set(self, make_entry):
         """Fat remaining is calculated when fat_goal is set."""
         settings = UserSettings(
             calorie_goal=2000,
@@ -103,24 +85,29 @@ class TestCalculateDailySummary:
             resting_energy=1800,
         )
         entries = [
-            FoodEntry(name="Food", calories=500, protein=30, carbs=50, fat=20),
+            make_entry(name="Food", calories=500, protein=30, carbs=50, fat=20),
         ]
         summary = calculate_daily_summary(entries, settings)
 
         assert summary.fat_remaining == 45
 
-    def test_fat_remaining_none_when_no_goal(self):
+    def test_fat_remaining_none_when_no_goal(self, default_settings):
         """Fat remaining is None when fat_goal not set."""
-        settings = UserSettings(
-            calorie_goal=2000,
-            protein_goal=150,
-            carb_goal=200,
-            resting_energy=1800,
-        )
-        summary = calculate_daily_summary([], settings)
+        summary = calculate_daily_summary([], default_settings)
 
         assert summary.fat_remaining is None
 
+    def test_rounded_when_dumped(self, default_settings, make_entry):
+        """Gram amounts are rounded to one decimal only on output."""
+        entries = [
+            make_entry(name="A", calories=10, protein=0.1, carbs=0, fat=0),
+            make_entry(name="B", calories=10, protein=0.2, carbs=0, fat=0),
+        ]
+        summary = calculate_daily_summary(entries, default_settings)
+
+        assert summary.model_dump()["total_protein"] == 0.3
+        assert summary.model_dump()["protein_remaining"] == 149.7
+
 
 class TestCalculateCaloriesFromMacros:
     """Tests for calculate_calories_from_macros."""
@@ -7,8 +7,10 @@ from pydantic import ValidationError
 from src.core.models import (
     UserSettings,
     FoodEntry,
+    FoodEntryInput,
     DailyLog,
     CachedFood,
+    DailySummary,
 )
 
 
@@ -98,6 +100,21 @@ class TestFoodEntry:
                 fat=5,
             )
 
+    def test_immutable(self):
+        """Entries are frozen value objects."""
+        entry = FoodEntry(name="Coffee", calories=65, protein=4.0, carbs=6.5, fat=2.5)
+        with pytest.raises(ValidationError):
+            entry.calories = 0
+
+
+class TestFoodEntryInput:
+    """Tests for FoodEntryInput model."""
+
+    def test_rejects_assigned_fields(self):
+        """Callers can't choose an entry's ID or log time."""
+        with pytest.raises(ValidationError):
+            FoodEntryInput(name="Coffee", calories=65, protein=4.0, carbs=6.5, fat=2.5, id="mine")
+
 
 class TestDailyLog:
     """Tests for DailyLog model."""
@@ -114,6 +131,16 @@ class TestDailyLog:
         log = DailyLog(log_date=date(2024, 12, 28), entries=[entry])
         assert len(log.entries) == 1
 
+    def test_immutable(self):
+        """Fields can't be reassigned; changes go through model_copy."""
+        log = DailyLog(log_date=date(2024, 12, 28))
+        with pytest.raises(ValidationError):
+            log.log_date = date(2024, 12, 29)
+        entry = FoodEntry(name="Food", calories=100, protein=10, carbs=10, fat=5)
+        updated = log.model_copy(update={"entries": [*log.entries, entry]})
+        assert log.entries == []
+        assert updated.entries == [entry]
+
 
 class TestCachedFood:
     """Tests for CachedFood model."""
@@ -130,3 +157,21 @@ class TestCachedFood:
         assert food.use_count == 0
         assert food.description is None
         assert food.id is not None
+
+
+class TestDailySummary:
+    """Tests for DailySummary model."""
+
+    def test_immutable(self):
+        """Summaries are frozen value objects."""
+        summary = DailySummary(
+            total_calories=500,
+            total_protein=30,
+            total_carbs=50,
+            total_fat=20,
+            calories_remaining=1500,
+            protein_remaining=120,
+            carbs_remaining=150,
+        )
+        with pytest.raises(ValidationError):
+            summary.total_calories = 0
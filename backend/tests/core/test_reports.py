@@ -2,11 +2,12 @@
 
 from datetime import date
 
-from src.core.models import FoodEntry, DailyLog, UserSettings
+from src.core.models import DailyLog
 from src.core.reports import (
     generate_day_summary,
     calculate_fat_added,
     generate_weekly_report,
+    index_logs_by_date,
 )
 
 
@@ -23,13 +24,22 @@ class TestGenerateDaySummary:
         assert summary.total_protein == 0
         assert summary.entry_count == 0
 
-    def test_log_with_entries(self):
+    def test_empty_log_gram_totals_are_floats(self):
+        """Empty days dump the same types as days with entries."""
+        log = DailyLog(log_date=date(2024, 12, 29), entries=[])
+        data = generate_day_summary(log).model_dump()
+
+        assert isinstance(data["total_calories"], int)
+        for key in ("total_protein", "total_carbs", "total_fat"):
+            assert isinstance(data[key], float)
+
+    def test_log_with_entries(self, make_entry):
         """Log with entries is summarized correctly."""
         log = DailyLog(
             log_date=date(2024, 12, 28),
             entries=[
-                FoodEntry(name="A", calories=100, protein=10, carbs=10, fat=5),
-                FoodEntry(name="B", calories=200, protein=20, carbs=20, fat=10),
+                make_entry(name="A", calories=100, protein=10, carbs=10, fat=5),
+                make_entry(name="B", calories=200, protein=20, carbs=20, fat=10),
             ],
         )
         summary = generate_day_summary(log)
@@ -40,6 +50,21 @@ class TestGenerateDaySummary:
         assert summary.total_fat == 15
         assert summary.entry_count == 2
 
+    def test_changed_entries_not_served_from_cache(self, make_entry):
+        """Editing a day's entries produces a fresh summary."""
+        before = DailyLog(
+            log_date=date(2024, 12, 28),
+            entries=[make_entry(name="A", calories=100, protein=10, carbs=10, fat=5)],
+        )
+        after = DailyLog(
+            log_date=date(2024, 12, 28),
+            entries=[make_entry(name="A", calories=150, protein=10, carbs=10, fat=5)],
+        )
+
+        assert generate_day_summary(before).total_calories == 100
+        assert generate_day_summary(after).total_calories == 150
+        assert generate_day_summary(before).total_calories == 100
+
 
 class TestCalculateFatAdded:
     """Tests for calculate_fat_added."""
@@ -86,17 +111,11 @@ class TestCalculateFatAdded:
 class TestGenerateWeeklyReport:
     """Tests for generate_weekly_report."""
 
-    def test_empty_week(self):
+    def test_empty_week(self, default_settings):
         """Empty week returns zeros."""
-        settings = UserSettings(
-            calorie_goal=2000,
-            protein_goal=150,
-            carb_goal=200,
-            resting_energy=1800,
-        )
         report = generate_weekly_report(
             logs=[],
-            settings=settings,
+            settings=default_settings,
             week_start=date(2024, 12, 22),
         )
 
@@ -107,31 +126,25 @@ class TestGenerateWeeklyReport:
         assert report.fat_added == 0
         assert len(report.daily_summaries) == 0
 
-    def test_partial_week(self):
+    def test_partial_week(self, default_settings, make_entry):
         """Partial week calculates correctly."""
-        settings = UserSettings(
-            calorie_goal=2000,
-            protein_goal=150,
-            carb_goal=200,
-            resting_energy=1800,
-        )
         logs = [
             DailyLog(
                 log_date=date(2024, 12, 25),
                 entries=[
-                    FoodEntry(name="A", calories=2000, protein=100, carbs=200, fat=50),
+                    make_entry(name="A", calories=2000, protein=100, carbs=200, fat=50),
                 ],
             ),
             DailyLog(
                 log_date=date(2024, 12, 26),
                 entries=[
-                    FoodEntry(name="B", calories=2200, protein=120, carbs=220, fat=60),
+                    make_entry(name="B", calories=2200, protein=120, carbs=220, fat=60),
                 ],
             ),
         ]
         report = generate_weekly_report(
             logs=logs,
-            settings=settings,
+            settings=default_settings,
             week_start=date(2024, 12, 22),
         )
 
@@ -141,31 +154,25 @@ class TestGenerateWeeklyReport:
         # fat_added = 4200 - (2 days * 1800) = 4200 - 3600 = 600
         assert report.fat_added == 600
 
-    def test_full_week(self):
+    def test_full_week(self, default_settings, make_entry):
         """Full week calculates correctly."""
-        settings = UserSettings(
-            calorie_goal=2000,
-            protein_goal=150,
-            carb_goal=200,
-            resting_energy=1800,
-        )
-
-        # Create 7 days of logs, each with 2000 calories
+        # Create 7 days of logs, each with 2000 calories (constant data, so
+        # skip validation)
         logs = []
         for day_offset in range(7):
             the_date = date(2024, 12, 22 + day_offset)
             logs.append(
-                DailyLog(
+                DailyLog.model_construct(
                     log_date=the_date,
                     entries=[
-                        FoodEntry(name="Day food", calories=2000, protein=100, carbs=200, fat=50),
+                        make_entry(name="Day food", calories=2000, protein=100, carbs=200, fat=50),
                     ],
                 )
             )
 
         report = generate_weekly_report(
             logs=logs,
-            settings=settings,
+            settings=default_settings,
             week_start=date(2024, 12, 22),
         )
 
@@ -175,67 +182,74 @@ class TestGenerateWeeklyReport:
         # fat_added = 14000 - (7 * 1800) = 14000 - 12600 = 1400
         assert report.fat_added == 1400
 
-    def test_logs_outside_week_excluded(self):
+    def test_logs_outside_week_excluded(self, default_settings, make_entry):
         """Logs outside the requested week are excluded."""
-        settings = UserSettings(
-            calorie_goal=2000,
-            protein_goal=150,
-            carb_goal=200,
-            resting_energy=1800,
-        )
         logs = [
             # This log is before the week
             DailyLog(
                 log_date=date(2024, 12, 20),
                 entries=[
-                    FoodEntry(name="Old", calories=5000, protein=100, carbs=200, fat=50),
+                    make_entry(name="Old", calories=5000, protein=100, carbs=200, fat=50),
                 ],
             ),
             # This log is within the week
             DailyLog(
                 log_date=date(2024, 12, 25),
                 entries=[
-                    FoodEntry(name="Current", calories=2000, protein=100, carbs=200, fat=50),
+                    make_entry(name="Current", calories=2000, protein=100, carbs=200, fat=50),
                 ],
             ),
         ]
         report = generate_weekly_report(
             logs=logs,
-            settings=settings,
+            settings=default_settings,
             week_start=date(2024, 12, 22),
         )
 
         assert report.days_logged == 1
         assert report.total_calories == 2000
 
-    def test_daily_summaries_sorted_by_date(self):
+    def test_daily_summaries_sorted_by_date(self, default_settings, make_entry):
         """Daily summaries are sorted by date."""
-        settings = UserSettings(
-            calorie_goal=2000,
-            protein_goal=150,
-            carb_goal=200,
-            resting_energy=1800,
-        )
         # Add logs out of order
         logs = [
             DailyLog(
                 log_date=date(2024, 12, 27),
-                entries=[FoodEntry(name="C", calories=300, protein=30, carbs=30, fat=15)],
+                entries=[make_entry(name="C", calories=300, protein=30, carbs=30, fat=15)],
             ),
             DailyLog(
                 log_date=date(2024, 12, 25),
-                entries=[FoodEntry(name="A", calories=100, protein=10, carbs=10, fat=5)],
+                entries=[make_entry(name="A", calories=100, protein=10, carbs=10, fat=5)],
             ),
             DailyLog(
                 log_date=date(2024, 12, 26),
-                entries=[FoodEntry(name="B", calories=200, protein=20, carbs=20, fat=10)],
+                entries=[make_entry(name="B", calories=200, protein=20, carbs=20, fat=10)],
             ),
         ]
         report = generate_weekly_report(
             logs=logs,
-            settings=settings,
+            settings=default_settings,
             week_start=date(2024, 12, 22),
         )
 
         dates = [s.log_date for s in report.daily_summaries]
         assert dates == [date(2024, 12, 25), date(2024, 12, 26), date(2024, 12, 27)]
+
+    def test_accepts_logs_indexed_by_date(self, default_settings, make_entry):
+        """Pre-indexed logs can be reused across adjacent weeks."""
+        logs_by_date = index_logs_by_date([
+            DailyLog(
+                log_date=date(2024, 12, 20),
+                entries=[make_entry(name="A", calories=1000, protein=10, carbs=10, fat=5)],
+            ),
+            DailyLog(
+                log_date=date(2024, 12, 25),
+                entries=[make_entry(name="B", calories=2000, protein=20, carbs=20, fat=10)],
+            ),
+        ])
+
+        this_week = generate_weekly_report(logs_by_date, default_settings, date(2024, 12, 22))
+        last_week = generate_weekly_report(logs_by_date, default_settings, date(2024, 12, 15))
+
+        assert this_week.total_calories == 2000
+        assert last_week.total_calories == 1000
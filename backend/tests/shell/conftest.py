@@ -0,0 +1,75 @@
+"""Shared fixtures for shell tests."""
+
+from types import SimpleNamespace
+
+import pytest
+from starlette.testclient import TestClient
+
+from src.shell.auth import generate_api_key
+
+
+class FakeDocument:
+    """Document reference whose existence is set on the owning FakeFirestore."""
+
+    def __init__(self, db: "FakeFirestore") -> None:
+        self._db = db
+
+    def get(self, field_paths=None):
+        return SimpleNamespace(exists=self._db.docs_exist)
+
+    def set(self, data: dict) -> None:
+        self._db.writes.append(data)
+
+
+class FakeCollection:
+    """Collection reference handing out FakeDocuments."""
+
+    def __init__(self, db: "FakeFirestore") -> None:
+        self._db = db
+
+    def document(self, document_id: str | None = None) -> FakeDocument:
+        return FakeDocument(self._db)
+
+
+class FakeFirestore:
+    """Stand-in for firestore.Client covering the calls the auth routes make.
+
+    Attributes:
+        docs_exist: Whether every document lookup finds a document
+        writes: Data passed to set(), in order
+    """
+
+    def __init__(self) -> None:
+        self.docs_exist = False
+        self.writes: list[dict] = []
+
+    def collection(self, name: str) -> FakeCollection:
+        return FakeCollection(self)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client for the app, built once for the whole session."""
+    # Imported here so runs that select no API tests don't load the app
+    from src.main import create_app
+
+    return TestClient(create_app())
+
+
+@pytest.fixture(scope="module")
+def sample_key():
+    """A well-formed API key, generated once per module."""
+    return generate_api_key()
+
+
+@pytest.fixture
+def fake_firestore(monkeypatch):
+    """Fake Firestore client, fresh for each test."""
+    db = FakeFirestore()
+    monkeypatch.setattr(
+        "src.shell.firestore_client.firestore.Client", lambda *args, **kwargs: db
+    )
+    # Drop clients created by earlier tests so they pick up this fake
+    monkeypatch.setattr("src.shell.mcp_server._firestore_client", None)
+    monkeypatch.setattr("src.shell.mcp_server._auth_client", None)
+    return db
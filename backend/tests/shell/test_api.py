@@ -1,27 +1,9 @@
 """Integration tests for API endpoints using Starlette TestClient."""
 
 import pytest
-from unittest.mock import MagicMock, patch
-from starlette.testclient import TestClient
 
-from src.main import create_app
-from src.shell.auth import generate_api_key, hash_api_key
-
-
-@pytest.fixture
-def mock_firestore():
-    """Mock Firestore client for testing."""
-    with patch("src.shell.mcp_server.firestore") as mock_fs:
-        mock_client = MagicMock()
-        mock_fs.Client.return_value = mock_client
-        yield mock_client
-
-
-@pytest.fixture
-def client(mock_firestore):
-    """Create test client with mocked Firestore."""
-    app = create_app()
-    return TestClient(app)
+# Placeholder for the sample_key fixture in parametrized cases
+SAMPLE_KEY = object()
 
 
 class TestHealthEndpoint:
@@ -43,12 +25,8 @@ class TestHealthEndpoint:
 class TestRegisterEndpoint:
     """Tests for /auth/register endpoint."""
 
-    def test_register_success(self, client, mock_firestore):
+    def test_register_success(self, client, fake_firestore):
         """Successful registration returns API key."""
-        # Mock the document set operation
-        mock_doc = MagicMock()
-        mock_firestore.collection.return_value.document.return_value = mock_doc
-
         response = client.post(
             "/auth/register",
             json={"email": "test@example.com"}
@@ -60,113 +38,74 @@ class TestRegisterEndpoint:
         assert data["api_key"].startswith("flr_")
         assert "message" in data
         assert "claude_command" in data
-
-    def test_register_missing_email(self, client):
-        """Registration without email returns 400."""
-        response = client.post("/auth/register", json={})
+        assert fake_firestore.writes[0]["email"] == "test@example.com"
+
+    @pytest.mark.parametrize(
+        "payload",
+        [{}, {"email": "not-an-email"}, {"email": ""}],
+        ids=["missing", "invalid", "empty"],
+    )
+    def test_register_bad_email(self, client, payload):
+        """Registration without a valid email returns 400."""
+        response = client.post("/auth/register", json=payload)
         assert response.status_code == 400
         assert "error" in response.json()
 
-    def test_register_invalid_email(self, client):
-        """Registration with invalid email returns 400."""
-        response = client.post(
-            "/auth/register",
-            json={"email": "not-an-email"}
-        )
-        assert response.status_code == 400
-        assert "error" in response.json()
-
-    def test_register_empty_email(self, client):
-        """Registration with empty email returns 400."""
-        response = client.post(
-            "/auth/register",
-            json={"email": ""}
-        )
-        assert response.status_code == 400
-
 
 class TestValidateEndpoint:
     """Tests for /auth/validate endpoint."""
 
-    def test_validate_missing_key(self, client):
-        """Validation without key returns invalid."""
-        response = client.post("/auth/validate", json={})
-        data = response.json()
-        assert data["valid"] is False
-
-    def test_validate_invalid_format(self, client):
-        """Validation with invalid format returns invalid."""
-        response = client.post(
-            "/auth/validate",
-            json={"api_key": "invalid_key"}
-        )
-        data = response.json()
-        assert data["valid"] is False
-
-    def test_validate_nonexistent_key(self, client, mock_firestore):
-        """Validation of non-existent key returns invalid."""
-        # Mock document that doesn't exist
-        mock_doc = MagicMock()
-        mock_doc.get.return_value.exists = False
-        mock_firestore.collection.return_value.document.return_value = mock_doc
-
-        valid_format_key = generate_api_key()
-        response = client.post(
-            "/auth/validate",
-            json={"api_key": valid_format_key}
-        )
-        data = response.json()
-        assert data["valid"] is False
-
-    def test_validate_existing_key(self, client, mock_firestore):
-        """Validation of existing key returns valid."""
-        # Mock document that exists
-        mock_doc = MagicMock()
-        mock_doc.get.return_value.exists = True
-        mock_firestore.collection.return_value.document.return_value = mock_doc
-
-        valid_key = generate_api_key()
-        response = client.post(
-            "/auth/validate",
-            json={"api_key": valid_key}
-        )
-        data = response.json()
-        assert data["valid"] is True
+    @pytest.mark.parametrize(
+        "api_key, user_exists, expected_valid",
+        [
+            (None, False, False),
+            ("invalid_key", False, False),
+            (SAMPLE_KEY, False, False),
+            (SAMPLE_KEY, True, True),
+        ],
+        ids=["missing", "invalid-format", "nonexistent", "existing"],
+    )
+    def test_validate(self, client, fake_firestore, sample_key, api_key, user_exists, expected_valid):
+        """Only well-formed keys of registered users are valid."""
+        fake_firestore.docs_exist = user_exists
+        if api_key is SAMPLE_KEY:
+            api_key = sample_key
+        payload = {} if api_key is None else {"api_key": api_key}
+
+        response = client.post("/auth/validate", json=payload)
+        assert response.json()["valid"] is expected_valid
 
 
 class TestCORS:
     """Tests for CORS configuration."""
 
-    def test_cors_preflight_allowed_origin(self, client):
-        """CORS preflight from allowed origin returns correct headers."""
+    @pytest.mark.parametrize("origin", ["https://foodlogr.app", "http://localhost:5173"])
+    def test_cors_preflight_allowed_origin(self, client, origin):
+        """CORS preflight from the site and local dev returns correct headers."""
         response = client.options(
             "/auth/register",
             headers={
-                "Origin": "https://foodlogr.app",
+                "Origin": origin,
                 "Access-Control-Request-Method": "POST",
                 "Access-Control-Request-Headers": "Content-Type",
             }
         )
         assert response.status_code == 200
-        assert response.headers.get("access-control-allow-origin") == "https://foodlogr.app"
+        assert response.headers.get("access-control-allow-origin") == origin
 
-    def test_cors_preflight_localhost(self, client):
-        """CORS preflight from localhost is allowed for dev."""
+    def test_cors_preflight_cached(self, client):
+        """CORS preflight response can be cached by the browser."""
         response = client.options(
             "/auth/register",
             headers={
-                "Origin": "http://localhost:5173",
+                "Origin": "https://foodlogr.app",
                 "Access-Control-Request-Method": "POST",
             }
         )
-        assert response.status_code == 200
-        assert response.headers.get("access-control-allow-origin") == "http://localhost:5173"
+        assert response.headers.get("access-control-max-age") == "86400"
 
-    def test_cors_actual_request(self, client, mock_firestore):
+    def test_cors_actual_request(self, client, fake_firestore):
         """Actual request from allowed origin includes CORS headers."""
-        mock_doc = MagicMock()
-        mock_firestore.collection.return_value.document.return_value = mock_doc
-
         response = client.post(
             "/auth/register",
             json={"email": "test@example.com"},
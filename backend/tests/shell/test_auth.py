@@ -1,6 +1,10 @@
-"""Unit tests for auth module - pure functions only."""
+"""Unit tests for auth module - pure functions and AuthClient caching."""
+
+import hashlib
+from unittest.mock import MagicMock
 
 from src.shell.auth import (
+    AuthClient,
     generate_api_key,
     hash_api_key,
     validate_api_key_format,
@@ -11,21 +15,20 @@ from src.shell.auth import (
 class TestGenerateApiKey:
     """Tests for generate_api_key."""
 
-    def test_starts_with_prefix(self):
+    def test_starts_with_prefix(self, sample_key):
         """Generated key starts with flr_ prefix."""
-        key = generate_api_key()
-        assert key.startswith(API_KEY_PREFIX)
+        assert sample_key.startswith(API_KEY_PREFIX)
 
-    def test_sufficient_length(self):
+    def test_sufficient_length(self, sample_key):
         """Generated key has sufficient length for security."""
-        key = generate_api_key()
         # prefix (4) + base64 encoded 32 bytes (~43 chars)
-        assert len(key) >= 40
+        assert len(sample_key) >= 40
 
     def test_unique_keys(self):
         """Each generated key is unique."""
-        keys = [generate_api_key() for _ in range(100)]
-        assert len(set(keys)) == 100
+        # 256 random bits per key; 16 draws are plenty to catch a broken RNG
+        keys = [generate_api_key() for _ in range(16)]
+        assert len(set(keys)) == 16
 
 
 class TestHashApiKey:
@@ -54,14 +57,18 @@ class TestHashApiKey:
         hashed = hash_api_key(key)
         assert all(c in "0123456789abcdef" for c in hashed)
 
+    def test_matches_stored_user_ids(self):
+        """Hash stays compatible with user_ids already stored in Firestore."""
+        key = "flr_test_key_12345678901234567890"
+        assert hash_api_key(key) == hashlib.sha256(key.encode()).hexdigest()[:32]
+
 
 class TestValidateApiKeyFormat:
     """Tests for validate_api_key_format."""
 
-    def test_valid_key(self):
+    def test_valid_key(self, sample_key):
         """Valid key format returns True."""
-        key = generate_api_key()
-        assert validate_api_key_format(key) is True
+        assert validate_api_key_format(sample_key) is True
 
     def test_empty_string(self):
         """Empty string returns False."""
@@ -93,3 +100,29 @@ class TestValidateApiKeyFormat:
         """Key below minimum length returns False."""
         key = "flr_" + "a" * 35
         assert validate_api_key_format(key) is False
+
+
+class TestAuthClientUserExists:
+    """Tests for AuthClient.user_exists caching."""
+
+    def _client(self, exists: bool) -> tuple[AuthClient, MagicMock]:
+        db = MagicMock()
+        user_ref = db.collection.return_value.document.return_value
+        user_ref.get.return_value.exists = exists
+        return AuthClient(db), user_ref
+
+    def test_existing_user_cached(self):
+        """A confirmed user is not looked up again within the TTL."""
+        auth, user_ref = self._client(exists=True)
+
+        assert auth.user_exists("user123") is True
+        assert auth.user_exists("user123") is True
+        assert user_ref.get.call_count == 1
+
+    def test_missing_user_not_cached(self):
+        """Unknown users are checked against Firestore every time."""
+        auth, user_ref = self._client(exists=False)
+
+        assert auth.user_exists("user123") is False
+        assert auth.user_exists("user123") is False
+        assert user_ref.get.call_count == 2
@@ -0,0 +1,503 @@
+"""Unit tests for FoodLogFirestoreClient - Firestore is mocked."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from google.api_core.exceptions import FailedPrecondition
+from google.cloud import firestore
+from pydantic import ValidationError
+
+from src.core.models import CachedFood, FoodEntry, UserSettings
+from src.shell.firestore_client import FoodLogFirestoreClient, _cache_search_fields
+
+
+SETTINGS_DATA = {
+    "calorie_goal": 2000,
+    "protein_goal": 150,
+    "carb_goal": 200,
+    "resting_energy": 1800,
+}
+
+
+@pytest.fixture
+def db():
+    """Firestore client wrapper backed by a MagicMock."""
+    client = FoodLogFirestoreClient()
+    client._client = MagicMock()
+    return client
+
+
+@pytest.fixture
+def transaction(db, monkeypatch):
+    """Run transactional functions directly against a mocked transaction."""
+    monkeypatch.setattr(
+        "src.shell.firestore_client.firestore.transactional", lambda fn: fn
+    )
+    return db.client.transaction.return_value
+
+
+def _log_doc(db: FoodLogFirestoreClient, entries: list[FoodEntry] | None) -> MagicMock:
+    """Mock the stored log for 2024-12-28 (None means no document).
+
+    Settings start out cached, so the log is read on its own.
+    """
+    db._cache_settings("user123", UserSettings(**SETTINGS_DATA))
+    log_ref = db._log_ref("user123", date(2024, 12, 28))
+    snapshot = log_ref.get.return_value
+    snapshot.exists = entries is not None
+    snapshot.to_dict.side_effect = lambda: {
+        "log_date": "2024-12-28",
+        "entries": [e.model_dump() for e in entries or []],
+    }
+    return log_ref
+
+
+def _settings_doc(db: FoodLogFirestoreClient) -> MagicMock:
+    """The mocked settings document reference."""
+    return db._settings_ref("user123")
+
+
+class TestSettingsCache:
+    """Tests for settings caching in get_settings/save_settings."""
+
+    def test_second_read_served_from_cache(self, db):
+        """Settings are fetched from Firestore only once within the TTL."""
+        doc = _settings_doc(db)
+        doc.get.return_value.exists = True
+        doc.get.return_value.to_dict.return_value = SETTINGS_DATA
+
+        first = db.get_settings("user123")
+        second = db.get_settings("user123")
+
+        assert first.calorie_goal == 2000
+        assert second is first
+        assert doc.get.call_count == 1
+
+    def test_missing_settings_not_cached(self, db):
+        """Users without settings are looked up again on the next call."""
+        doc = _settings_doc(db)
+        doc.get.return_value.exists = False
+
+        assert db.get_settings("user123") is None
+        assert db.get_settings("user123") is None
+        assert doc.get.call_count == 2
+
+    def test_save_writes_through(self, db):
+        """Saved settings are returned without another read."""
+        doc = _settings_doc(db)
+        settings = UserSettings(**SETTINGS_DATA)
+
+        assert db.save_settings("user123", settings) is True
+        assert db.get_settings("user123") is settings
+        doc.get.assert_not_called()
+
+
+class TestLogTransactions:
+    """Tests for add_entry/update_entry read-modify-write."""
+
+    LOG_DATE = date(2024, 12, 28)
+
+    def test_add_entry_creates_missing_log(self, db, transaction):
+        """Adding to a day without a log starts a new one."""
+        log_ref = _log_doc(db, None)
+        entry = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+
+        log = db.add_entry("user123", entry, self.LOG_DATE)
+
+        assert [e.id for e in log.entries] == [entry.id]
+        log_ref.get.assert_called_once_with(transaction=transaction)
+        transaction.set.assert_called_once()
+
+    def test_add_entries_writes_once(self, db, transaction):
+        """A whole meal is appended with a single read and write."""
+        existing = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+        log_ref = _log_doc(db, [existing])
+        meal = [
+            FoodEntry(name="Eggs", calories=140, protein=12, carbs=0, fat=10),
+            FoodEntry(name="Toast", calories=80, protein=3, carbs=15, fat=1),
+        ]
+
+        log = db.add_entries("user123", meal, self.LOG_DATE)
+
+        assert [e.name for e in log.entries] == ["Coffee", "Eggs", "Toast"]
+        log_ref.get.assert_called_once_with(transaction=transaction)
+        transaction.set.assert_called_once()
+
+    def test_unchanged_entries_written_as_stored(self, db, transaction):
+        """Entries already in the log are written back without a new dump."""
+        existing = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+        log_ref = _log_doc(db, [existing])
+        stored_entry = existing.model_dump()
+        log_ref.get.return_value.to_dict.side_effect = lambda: {
+            "log_date": "2024-12-28",
+            "entries": [stored_entry],
+        }
+        toast = FoodEntry(name="Toast", calories=80, protein=3, carbs=15, fat=1)
+
+        db.add_entry("user123", toast, self.LOG_DATE)
+
+        written = transaction.set.call_args.args[1]["entries"]
+        assert written[0] is stored_entry
+        assert written[1] == toast.model_dump()
+
+    def test_update_entry_applies_changes(self, db, transaction):
+        """Updated fields are merged into the stored entry."""
+        entry = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+        _log_doc(db, [entry])
+
+        log = db.update_entry("user123", entry.id, {"calories": 80}, self.LOG_DATE)
+
+        assert log.entries[0].calories == 80
+        transaction.set.assert_called_once()
+
+    def test_unchanged_update_skips_write(self, db, transaction):
+        """Setting fields to their current values doesn't rewrite the log."""
+        entry = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+        _log_doc(db, [entry])
+
+        log = db.update_entry("user123", entry.id, {"calories": 65, "protein": 4.0}, self.LOG_DATE)
+
+        assert log.entries[0].calories == 65
+        transaction.set.assert_not_called()
+
+    def test_update_missing_entry_skips_write(self, db, transaction):
+        """Updating an unknown entry fails without writing."""
+        _log_doc(db, [])
+
+        assert db.update_entry("user123", "nope", {"calories": 80}, self.LOG_DATE) is None
+        transaction.set.assert_not_called()
+
+    def test_invalid_update_raises(self, db, transaction):
+        """Invalid new values reach the caller instead of reading as a failure."""
+        entry = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+        _log_doc(db, [entry])
+
+        with pytest.raises(ValidationError):
+            db.update_entry("user123", entry.id, {"calories": -5}, self.LOG_DATE)
+        transaction.set.assert_not_called()
+
+
+class TestReadLogAndSettings:
+    """Tests for reading a log together with uncached settings."""
+
+    LOG_DATE = date(2024, 12, 28)
+
+    def _get_all(self, db, settings_exist: bool) -> MagicMock:
+        log_snapshot = MagicMock(exists=True)
+        log_snapshot.reference.path = "users/user123/logs/2024-12-28"
+        log_snapshot.to_dict.return_value = {"log_date": "2024-12-28", "entries": []}
+        settings_snapshot = MagicMock(exists=settings_exist)
+        settings_snapshot.reference = _settings_doc(db)
+        settings_snapshot.to_dict.return_value = SETTINGS_DATA
+        db.client.get_all.return_value = [settings_snapshot, log_snapshot]
+        return db.client.get_all
+
+    def test_fetches_both_in_one_call(self, db):
+        """Log and settings come back from a single get_all."""
+        get_all = self._get_all(db, settings_exist=True)
+
+        log, settings = db.get_log_and_settings("user123", self.LOG_DATE)
+
+        assert log.log_date == self.LOG_DATE
+        assert settings.calorie_goal == 2000
+        get_all.assert_called_once()
+        _settings_doc(db).get.assert_not_called()
+
+    def test_settings_cached_for_later_calls(self, db):
+        """Settings read alongside a log are served from cache afterwards."""
+        self._get_all(db, settings_exist=True)
+
+        db.get_log_and_settings("user123", self.LOG_DATE)
+
+        assert db.get_settings("user123").calorie_goal == 2000
+        _settings_doc(db).get.assert_not_called()
+
+    def test_missing_settings(self, db):
+        """Users without settings get the log and None."""
+        self._get_all(db, settings_exist=False)
+
+        log, settings = db.get_log_and_settings("user123", self.LOG_DATE)
+
+        assert log is not None
+        assert settings is None
+
+    def test_add_entry_reads_settings_in_transaction(self, db, transaction):
+        """The entry transaction fetches uncached settings with the log."""
+        get_all = self._get_all(db, settings_exist=True)
+        entry = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+
+        db.add_entry("user123", entry, self.LOG_DATE)
+
+        assert get_all.call_args.kwargs["transaction"] is transaction
+        assert db.get_settings("user123").calorie_goal == 2000
+
+
+class TestDeleteEntry:
+    """Tests for delete_entry."""
+
+    LOG_DATE = date(2024, 12, 28)
+
+    def test_removes_only_that_entry(self, db):
+        """The stored entry is removed server-side without rewriting the log."""
+        keep = FoodEntry(name="Eggs", calories=140, protein=12, carbs=0, fat=10)
+        drop = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+        log_ref = _log_doc(db, [keep, drop])
+
+        log = db.delete_entry("user123", drop.id, self.LOG_DATE)
+
+        assert [e.id for e in log.entries] == [keep.id]
+        update = log_ref.update.call_args.args[0]
+        assert update["entries"] == firestore.ArrayRemove([drop.model_dump()])
+        log_ref.set.assert_not_called()
+
+    def test_write_requires_unchanged_log(self, db):
+        """The removal only applies to the log version that was read."""
+        entry = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+        log_ref = _log_doc(db, [entry])
+        update_time = log_ref.get.return_value.update_time
+
+        db.delete_entry("user123", entry.id, self.LOG_DATE)
+
+        db.client.write_option.assert_called_once_with(last_update_time=update_time)
+        assert log_ref.update.call_args.kwargs["option"] is db.client.write_option.return_value
+
+    def test_changed_log_retries_in_transaction(self, db, transaction):
+        """A failed precondition falls back to a transactional delete."""
+        keep = FoodEntry(name="Eggs", calories=140, protein=12, carbs=0, fat=10)
+        drop = FoodEntry(name="Coffee", calories=65, protein=4, carbs=6.5, fat=2.5)
+        log_ref = _log_doc(db, [keep, drop])
+        log_ref.update.side_effect = FailedPrecondition("update_time mismatch")
+
+        log = db.delete_entry("user123", drop.id, self.LOG_DATE)
+
+        assert [e.id for e in log.entries] == [keep.id]
+        stored = transaction.set.call_args.args[1]
+        assert [e["id"] for e in stored["entries"]] == [keep.id]
+
+    def test_missing_entry_skips_write(self, db):
+        """Deleting an unknown entry fails without writing."""
+        log_ref = _log_doc(db, [])
+
+        assert db.delete_entry("user123", "nope", self.LOG_DATE) is None
+        log_ref.update.assert_not_called()
+
+
+class _CacheQuery:
+    """In-memory stand-in for the cache queries search_cache builds.
+
+    Supports array_contains filters, order_by, start_after and limit, with
+    Firestore's implicit document ID ordering as the final tiebreak.
+    """
+
+    def __init__(self, foods: list[CachedFood], orders=(), filters=(), after=None, limit=None):
+        self._foods = foods
+        self._orders = orders
+        self._filters = filters
+        self._after = after
+        self._limit = limit
+
+    def _with(self, **changes) -> "_CacheQuery":
+        state = dict(orders=self._orders, filters=self._filters, after=self._after, limit=self._limit)
+        state.update(changes)
+        return _CacheQuery(self._foods, **state)
+
+    def where(self, filter: firestore.FieldFilter) -> "_CacheQuery":
+        assert filter.op_string == "array_contains"
+        return self._with(filters=(*self._filters, filter))
+
+    def order_by(self, field: str, direction: str = firestore.Query.ASCENDING) -> "_CacheQuery":
+        return self._with(orders=(*self._orders, (field, direction)))
+
+    def start_after(self, snapshot: MagicMock) -> "_CacheQuery":
+        return self._with(after=snapshot.id)
+
+    def limit(self, count: int) -> "_CacheQuery":
+        return self._with(limit=count)
+
+    def document(self, food_id: str) -> MagicMock:
+        ref = MagicMock()
+        ref.get.return_value = MagicMock(id=food_id, exists=True)
+        return ref
+
+    def stream(self) -> list[MagicMock]:
+        docs = []
+        for food in self._foods:
+            data = {**food.model_dump(), **_cache_search_fields(food.name)}
+            if all(f.value in data[f.field_path] for f in self._filters):
+                docs.append((food.id, data))
+        # Sort by the last key first; document ID follows the last direction
+        last_direction = self._orders[-1][1] if self._orders else firestore.Query.ASCENDING
+        docs.sort(key=lambda d: d[0], reverse=last_direction == firestore.Query.DESCENDING)
+        for field, direction in reversed(self._orders):
+            docs.sort(key=lambda d: d[1][field], reverse=direction == firestore.Query.DESCENDING)
+        if self._after is not None:
+            docs = docs[[food_id for food_id, _ in docs].index(self._after) + 1:]
+        result = []
+        for food_id, data in docs[:self._limit]:
+            doc = MagicMock(id=food_id)
+            doc.to_dict.return_value = data
+            result.append(doc)
+        return result
+
+
+class TestFoodCache:
+    """Tests for search_cache/add_to_cache."""
+
+    @staticmethod
+    def _current_cache(db) -> MagicMock:
+        """The user's cache collection, already on the current search fields."""
+        db._user_ref("user123").get.return_value.to_dict.return_value = {"cache_search_version": 2}
+        return db._user_ref("user123").collection("cache")
+
+    def _cache(self, db, foods: list[CachedFood]) -> MagicMock:
+        """Back the user's cache collection with the given foods."""
+        cache = self._current_cache(db)
+        query = _CacheQuery(foods)
+        cache.where.side_effect = query.where
+        cache.order_by.side_effect = query.order_by
+        cache.document.side_effect = query.document
+        return cache
+
+    def test_add_stores_search_fields(self, db):
+        """Cached foods are written with the prefixes of their name and words."""
+        food = CachedFood(name="Greek Yogurt", calories=100, protein=17, carbs=6, fat=0.7)
+
+        assert db.add_to_cache("user123", food) is True
+
+        prefixes = db._cache_ref("user123", food.id).set.call_args.args[0]["name_prefixes"]
+        assert {"g", "greek", "greek y", "greek yogurt", "yog", "yogurt"} <= set(prefixes)
+        assert "reek" not in prefixes
+
+    def test_search_matches_prefix_and_word_by_use_count(self, db):
+        """Name and word matches come back together, most used first."""
+        yogurt = CachedFood(name="Greek Yogurt", calories=100, protein=17, carbs=6, fat=0.7, use_count=2)
+        salad = CachedFood(name="Plain Greek Salad", calories=200, protein=5, carbs=10, fat=15, use_count=9)
+        toast = CachedFood(name="Toast", calories=80, protein=3, carbs=15, fat=1, use_count=30)
+        self._cache(db, [yogurt, salad, toast])
+
+        results, next_cursor = db.search_cache("user123", "  GREEK ")
+
+        assert [f.id for f in results] == [salad.id, yogurt.id]
+        assert next_cursor is None
+
+    def test_empty_query_lists_most_used(self, db):
+        """Without a query the most used foods are returned."""
+        yogurt = CachedFood(name="Greek Yogurt", calories=100, protein=17, carbs=6, fat=0.7, use_count=2)
+        toast = CachedFood(name="Toast", calories=80, protein=3, carbs=15, fat=1, use_count=30)
+        cache = self._cache(db, [yogurt, toast])
+
+        results, _ = db.search_cache("user123", "")
+
+        assert [f.id for f in results] == [toast.id, yogurt.id]
+        cache.where.assert_not_called()
+
+    def test_pages_never_repeat(self, db):
+        """Paging through more than a page of matches returns each food once."""
+        foods = [
+            CachedFood(name=f"Greek Yogurt {i:02d}", calories=100, protein=17, carbs=6, fat=0.7, use_count=i % 4)
+            for i in range(25)
+        ]
+        # A word match that sorts after the first page of names
+        foods.append(CachedFood(name="Plain Greek Salad", calories=200, protein=5, carbs=10, fat=15, use_count=2))
+        self._cache(db, foods)
+
+        pages = []
+        results, cursor = db.search_cache("user123", "greek")
+        pages.append(results)
+        while cursor is not None:
+            results, cursor = db.search_cache("user123", "greek", cursor)
+            pages.append(results)
+
+        returned = [f.id for page in pages for f in page]
+        assert len(pages) == 2
+        assert sorted(returned) == sorted(f.id for f in foods)
+        assert [f.use_count for f in pages[0]] == sorted((f.use_count for f in foods), reverse=True)[:20]
+
+    def test_stale_cursor_ends_paging(self, db):
+        """A cursor whose document was deleted returns no more results."""
+        cache = self._current_cache(db)
+        cache.document.return_value.get.return_value.exists = False
+
+        assert db.search_cache("user123", "apple", "deleted") == ([], None)
+        cache.where.return_value.order_by.return_value.start_after.assert_not_called()
+
+    def test_failed_search_returns_nothing(self, db):
+        """A failing query (e.g. index still building) yields no matches."""
+        cache = self._current_cache(db)
+        search = cache.where.return_value.order_by.return_value.limit.return_value
+        search.stream.side_effect = RuntimeError("FAILED_PRECONDITION: index required")
+
+        assert db.search_cache("user123", "greek") == ([], None)
+
+    def test_current_caches_not_backfilled(self, db):
+        """Users already on the current search fields skip the backfill."""
+        self._cache(db, [])
+        user_ref = db._user_ref("user123")
+
+        db.search_cache("user123", "greek")
+
+        user_ref.collection("cache").select.assert_not_called()
+        user_ref.set.assert_not_called()
+
+    def test_legacy_foods_backfilled_once(self, db):
+        """Foods cached without the search fields get them on the first search."""
+        cache = self._cache(db, [])
+        user_ref = db._user_ref("user123")
+        user_ref.get.return_value.to_dict.return_value = {"cache_search_version": 1}
+        legacy, current = MagicMock(), MagicMock()
+        legacy.to_dict.return_value = {"name": "Greek Yogurt", "name_lc": "greek yogurt"}
+        current.to_dict.return_value = {"name": "Greek Salad", **_cache_search_fields("Greek Salad")}
+        cache.select.return_value.stream.return_value = [legacy, current]
+
+        db.search_cache("user123", "greek")
+        db.search_cache("user123", "yogurt")
+
+        batch = db.client.batch.return_value
+        batch.update.assert_called_once_with(legacy.reference, _cache_search_fields("Greek Yogurt"))
+        batch.commit.assert_called_once()
+        user_ref.set.assert_called_once_with({"cache_search_version": 2}, merge=True)
+        user_ref.get.assert_called_once()
+
+    def test_failed_backfill_retried(self, db):
+        """A user whose backfill failed is not marked as done."""
+        user_ref = db._user_ref("user123")
+        user_ref.get.return_value.exists = False
+        user_ref.collection("cache").select.return_value.stream.side_effect = RuntimeError("unavailable")
+
+        db.search_cache("user123", "greek")
+        db.search_cache("user123", "greek")
+
+        user_ref.set.assert_not_called()
+        assert user_ref.get.call_count == 2
+
+
+class TestGetLogsRange:
+    """Tests for get_logs_range."""
+
+    def test_batch_gets_each_day(self, db):
+        """Every day in the range is fetched in one get_all call."""
+        snapshots = []
+        for day, exists in [(24, True), (22, True), (23, False)]:
+            snapshot = MagicMock(exists=exists)
+            snapshot.to_dict.return_value = {"log_date": f"2024-12-{day}", "entries": []}
+            snapshots.append(snapshot)
+        db.client.get_all.return_value = snapshots
+
+        logs = db.get_logs_range("user123", date(2024, 12, 22), date(2024, 12, 24))
+
+        assert [log.log_date for log in logs] == [date(2024, 12, 22), date(2024, 12, 24)]
+        assert len(db.client.get_all.call_args.args[0]) == 3
+        assert db.client.get_all.call_args.kwargs["field_paths"] == ["log_date", "entries"]
+
+
+class TestIncrementCacheUse:
+    """Tests for increment_cache_use."""
+
+    def test_increments_counter(self, db):
+        """The counter is bumped server-side without reading the food."""
+        assert db.increment_cache_use("user123", "food1") is True
+
+        cache_ref = db._cache_ref("user123", "food1")
+        assert cache_ref.update.call_args.args[0]["use_count"] == firestore.Increment(1)
+        cache_ref.get.assert_not_called()